@@ -1,5 +1,8 @@
 import streamlit as st
+import asyncio
 import subprocess
+import time
+from collections import deque
 from pathlib import Path
 import os
 import sys
@@ -12,13 +15,59 @@ st.set_page_config(page_title="HIGHspeed Hub", layout="wide")
 # -------------------------
 # Helpers
 # -------------------------
-def _run(cmd: list[str]) -> tuple[int, str]:
-    p = subprocess.run(cmd, capture_output=True, text=True)
-    out = (p.stdout or "") + (p.stderr or "")
-    return p.returncode, out.strip()
+RUN_MAX_LINES = 500
+
+def _run(cmd: list[str], live=None) -> tuple[int, str]:
+    # zeilenweise lesen statt alles puffern; nur die letzten RUN_MAX_LINES behalten
+    lines: deque[str] = deque(maxlen=RUN_MAX_LINES)
+    last_push = 0.0
+    with subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,  # kein stdin-Pipe; sudo -n / systemctl fragen nie nach
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as p:
+        for line in p.stdout:
+            lines.append(line.rstrip("\n"))
+            # optional live ins UI (st.empty()), gedrosselt auf ~4 Updates/s
+            if live is not None and time.monotonic() - last_push > 0.25:
+                live.code("\n".join(lines))
+                last_push = time.monotonic()
+        code = p.wait()
+    return code, "\n".join(lines).strip()
+
+DEPLOY_SERVICES = [
+    "highspeed-web-deploy.service",
+    "highspeed-toolbox-deploy.service",
+]
+
+async def _start_service(service: str) -> tuple[str, int, str]:
+    p = await asyncio.create_subprocess_exec(
+        "/bin/systemctl", "start", service,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    out, _ = await p.communicate()
+    return service, p.returncode, (out or b"").decode("utf-8", "replace").strip()
+
+async def _deploy_many(services: list[str]) -> list[tuple[str, int, str]]:
+    # parallel starten -> Gesamtdauer = max statt Summe
+    return await asyncio.gather(*(_start_service(s) for s in services))
+
+def _show_result(code: int, out: str) -> None:
+    st.success("OK" if code == 0 else "FAIL")
+    if out:
+        st.code(out)
 
 def sudo_journal(service: str) -> tuple[int, str]:
-    return _run(["sudo", "-n", "/usr/bin/journalctl", "-u", service, "-n", "120", "--no-pager"])
+    # kein --since: ruhige Services hätten sonst ein leeres Log; -q spart die Meta-Zeilen
+    return _run([
+        "sudo", "-n", "/usr/bin/journalctl", "-u", service,
+        "-n", "120", "--no-pager", "-q", "--output=short",
+    ])
 
 # -------------------------
 # Paths (Raspberry)
@@ -29,20 +78,12 @@ SCRIPT_PULL = PUBLISHER_DIR / "data_pull.sh"
 SERVER_MODE = (os.name != "nt" and PUBLISHER_DIR.exists())
 
 # -------------------------
-# Import PUX results renderer
+# Import-Pfad für tools/ (Renderer selbst laden erst die Pages)
 # -------------------------
 APP_DIR = Path(__file__).resolve().parent
 if str(APP_DIR) not in sys.path:
     sys.path.insert(0, str(APP_DIR))
 
-try:
-    from tools.puls_renderer import results_renderer
-except Exception as e:
-    results_renderer = None
-    RESULTS_IMPORT_ERR = str(e)
-else:
-    RESULTS_IMPORT_ERR = ""
-
 
 # ============================================================
 # Sidebar
@@ -54,15 +95,20 @@ with st.sidebar:
     with c1:
         if st.button("DEPLOY · Web jetzt", use_container_width=True):
             code, out = _run(["/bin/systemctl", "start", "highspeed-web-deploy.service"])
-            st.success("OK" if code == 0 else "FAIL")
-            if out:
-                st.code(out)
+            _show_result(code, out)
 
     with c2:
         if st.button("DEPLOY · Toolbox jetzt", use_container_width=True):
             # FIX: richtiger Service!
             code, out = _run(["/bin/systemctl", "start", "highspeed-toolbox-deploy.service"])
-            st.success("OK" if code == 0 else "FAIL")
+            _show_result(code, out)
+
+    if st.button("DEPLOY · Beide", use_container_width=True):
+        for svc, code, out in asyncio.run(_deploy_many(DEPLOY_SERVICES)):
+            if code == 0:
+                st.success(f"{svc}: OK")
+            else:
+                st.error(f"{svc}: FAIL")
             if out:
                 st.code(out)
 
@@ -78,27 +124,24 @@ with st.sidebar:
             c3, c4 = st.columns(2)
             with c3:
                 if st.button("⬇️ Pull Data (DEV)", use_container_width=True):
-                    code, out = _run([str(SCRIPT_PULL), "dev"])
-                    st.success("OK" if code == 0 else "FAIL")
-                    if out:
-                        st.code(out)
+                    live = st.empty()
+                    code, out = _run([str(SCRIPT_PULL), "dev"], live=live)
+                    live.empty()
+                    _show_result(code, out)
 
             with c4:
                 if st.button("⬇️ Pull Data (MAIN)", use_container_width=True):
-                    code, out = _run([str(SCRIPT_PULL), "main"])
-                    st.success("OK" if code == 0 else "FAIL")
-                    if out:
-                        st.code(out)
+                    live = st.empty()
+                    code, out = _run([str(SCRIPT_PULL), "main"], live=live)
+                    live.empty()
+                    _show_result(code, out)
 
     st.divider()
     st.markdown("## 🧾 Deploy-Logs")
 
     service = st.selectbox(
         "Service",
-        [
-            "highspeed-web-deploy.service",
-            "highspeed-toolbox-deploy.service",
-        ],
+        DEPLOY_SERVICES,
     )
     if st.button("Logs anzeigen", use_container_width=True):
         code, out = sudo_journal(service)
@@ -6,6 +6,21 @@ cd /opt/highspeed/toolbox
 git fetch origin main
 git reset --hard origin/main
 
-/opt/highspeed/toolbox/.venv/bin/pip install -U streamlit pillow numpy pandas matplotlib requests
+PIP=/opt/highspeed/toolbox/.venv/bin/pip
+PY=/opt/highspeed/toolbox/.venv/bin/python
+# Pillow-Variante: PILLOW_PKG=pillow-simd für den SSE4/AVX2-Build (nur x86, wird aus Source gebaut)
+PILLOW_PKG="${PILLOW_PKG:-pillow}"
+
+$PIP install -U streamlit pillow numpy pandas matplotlib requests orjson xxhash rapidfuzz pyahocorasick
+
+if [ "$PILLOW_PKG" = "pillow-simd" ]; then
+  # streamlit zieht "pillow" als Abhängigkeit -> danach ersetzen, sonst überschreibt es PIL wieder
+  $PIP uninstall -y pillow
+  CC="cc -mavx2" $PIP install -U --no-binary :all: --force-reinstall pillow-simd
+fi
+
+# vorskalierte Logos (<team>@<size>.png) -> Renderer spart Decode der 3000px-Quellen + LANCZOS
+# optional: schlägt das fehl, rendern die Renderer einfach aus den Originalen -> Deploy nicht abbrechen
+$PY -c "from pathlib import Path; from tools.puls_renderer.logo_sidecars import prebuild_logo_sidecars as b; print('logo sidecars:', b(Path('tools/puls_renderer/assets/logos')))" || true
 
 sudo systemctl restart highspeed-toolbox
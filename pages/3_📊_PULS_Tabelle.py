@@ -1,13 +1,36 @@
+import os
 import re
 import streamlit as st
 from pathlib import Path
 
+from tools._limits import RENDER_LOCK
+from tools._render_cache import asset_stamp, write_bytes_if_changed
+
 from tools.puls_renderer import render_table_from_matchday_json
 
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_render(
+    matchday_path_str: str,
+    mtime: float,
+    assets: tuple,
+    template_name: str,
+    delta_date: str,
+) -> tuple[str, bytes]:
+    # assets (Template/Logos/Fonts/Display-Map-mtimes) nur als Cache-Key
+    with RENDER_LOCK:
+        out = Path(render_table_from_matchday_json(
+            matchday_json_path=Path(matchday_path_str),
+            template_name=template_name,
+            delta_date=delta_date,
+        ))
+    return str(out), out.read_bytes()
+
 st.title("📊 PULS Tabellen-Renderer")
 
 BASE_DIR = Path(__file__).resolve().parent.parent  # repo root (wenn pages/ eine Ebene tiefer liegt)
 SPIELTAGE_ROOT = BASE_DIR / "data" / "spieltage"
+PULS_ASSETS = BASE_DIR / "tools" / "puls_renderer" / "assets"
 
 # -----------------------------
 # Helpers
@@ -18,17 +41,23 @@ def _to_index(value: str) -> int:
         return -1
     return int(m.group(1))
 
+_MATCHDAY_RX = re.compile(r"spieltag_[0-9]{2}\.json")
+
 def list_seasons(root: Path) -> list[Path]:
     if not root.exists():
         return []
-    seasons = [p for p in root.iterdir() if p.is_dir() and p.name.startswith("saison_")]
+    # scandir: Typ kommt aus dem dirent, kein extra stat() pro Eintrag
+    with os.scandir(root) as it:
+        seasons = [Path(e.path) for e in it if e.name.startswith("saison_") and e.is_dir()]
     seasons.sort(key=lambda p: _to_index(p.name))
     return seasons
 
 def list_matchdays(season_dir: Path) -> list[Path]:
     if not season_dir.exists():
         return []
-    files = sorted(season_dir.glob("spieltag_[0-9][0-9].json"), key=lambda p: _to_index(p.name))
+    with os.scandir(season_dir) as it:
+        files = [Path(e.path) for e in it if _MATCHDAY_RX.fullmatch(e.name) and e.is_file()]
+    files.sort(key=lambda p: _to_index(p.name))
     return files
 
 # -----------------------------
@@ -40,11 +69,10 @@ if not seasons:
     st.warning(f"Keine Saison-Ordner gefunden unter: {SPIELTAGE_ROOT.as_posix()}")
     st.stop()
 
-season_labels = [p.name for p in seasons]
-default_season_idx = max(0, len(season_labels) - 1)  # letzte Saison als Default
+default_season_idx = max(0, len(seasons) - 1)  # letzte Saison als Default
 
-selected_season_label = st.selectbox("Saison auswählen", season_labels, index=default_season_idx)
-season_dir = SPIELTAGE_ROOT / selected_season_label
+# Pfade direkt als Optionen, Label nur über format_func -> keine Label-Listen pro Rerun
+season_dir: Path = st.selectbox("Saison auswählen", seasons, index=default_season_idx, format_func=lambda p: p.name)
 
 # -----------------------------
 # Spieltag-Auswahl
@@ -55,11 +83,9 @@ if not files:
     st.warning(f"Keine spieltag_XX.json gefunden unter: {season_dir.as_posix()}")
     st.stop()
 
-file_labels = [p.name for p in files]
-default_file_idx = max(0, len(file_labels) - 1)  # letzter Spieltag als Default
+default_file_idx = max(0, len(files) - 1)  # letzter Spieltag als Default
 
-selected_file_label = st.selectbox("Spieltag JSON auswählen", file_labels, index=default_file_idx)
-selected_file = season_dir / selected_file_label
+selected_file: Path = st.selectbox("Spieltag JSON auswählen", files, index=default_file_idx, format_func=lambda p: p.name)
 
 # -----------------------------
 # Inputs
@@ -72,15 +98,23 @@ template_name = st.text_input("Template (assets/templates)", value="league_table
 # -----------------------------
 if st.button("Rendern"):
     try:
-        out = render_table_from_matchday_json(
-            matchday_json_path=selected_file,
-            template_name=template_name,
-            delta_date=delta_date,
+        out, png_bytes = _cached_render(
+            str(selected_file),
+            selected_file.stat().st_mtime,
+            asset_stamp(
+                PULS_ASSETS / "templates" / template_name,
+                PULS_ASSETS / "logos",
+                PULS_ASSETS / "fonts",
+                PULS_ASSETS / "team_display_names.json",
+            ),
+            template_name,
+            delta_date,
         )
+        # Cache-Treffer: Datei am Pfad kann von einer anderen Saison überschrieben sein
+        write_bytes_if_changed(Path(out), png_bytes)
         st.success(f"OK: {out}")
-        st.image(str(out))
+        st.image(png_bytes)
 
-        png_bytes = Path(out).read_bytes()
         st.download_button(
             "PNG herunterladen",
             data=png_bytes,
@@ -2,7 +2,32 @@ import re
 import streamlit as st
 from pathlib import Path
 
-from tools.puls_renderer import render_from_json_file
+from tools._limits import RENDER_LOCK
+from tools._render_cache import asset_stamp, copy_upload_if_changed, write_bytes_if_changed
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_render(
+    json_path_str: str,
+    mtime: float,
+    assets: tuple,
+    enable_vs: bool,
+    delta_date: str,
+    enable_team_fx: bool,
+) -> tuple[str, bytes]:
+    # mtime + Asset-mtimes im Key -> geänderte JSON/Template/Logos rendern neu
+    # Import erst beim Rendern: PIL/Fonts nur laden, wenn wirklich gerendert wird
+    from tools.puls_renderer import render_from_json_file
+
+    with RENDER_LOCK:
+        out_path = Path(render_from_json_file(
+            json_path=Path(json_path_str),
+            enable_draw_vs=enable_vs,
+            delta_date=delta_date,
+            enable_fx_on_teams=enable_team_fx,
+            header_fx="ice_noise",
+        ))
+    return str(out_path), out_path.read_bytes()
 
 st.set_page_config(page_title="PULS Renderer", layout="centered")
 
@@ -12,6 +37,7 @@ st.caption("JSON rein → Spieltagsübersicht PNG raus. Δ-Datum kommt aus UI (n
 BASE_DIR = Path(__file__).resolve().parent.parent  # Projektroot (app.py liegt dort)
 SPIELTAGE_ROOT = BASE_DIR / "data" / "spieltage"   # <- root, darunter saison_XX
 SPIELTAGE_ROOT.mkdir(parents=True, exist_ok=True)
+PULS_ASSETS = BASE_DIR / "tools" / "puls_renderer" / "assets"
 
 # ----------------------------
 # Helpers
@@ -86,9 +112,13 @@ json_path: Path | None = None
 if uploaded is not None:
     # Upload immer in die gewählte Saison speichern
     target = DATA_DIR / uploaded.name
-    target.write_bytes(uploaded.getvalue())
+    # streamen statt getvalue(), atomar über .tmp; unveränderter Inhalt wird nicht neu
+    # geschrieben -> mtime bleibt, der Render-Cache greift auch bei jedem Rerun
+    if copy_upload_if_changed(uploaded, uploaded.size, target):
+        st.success(f"Gespeichert: data/spieltage/{season_folder(sel_season)}/{uploaded.name}")
+    else:
+        st.caption(f"Unverändert: data/spieltage/{season_folder(sel_season)}/{uploaded.name}")
     json_path = target
-    st.success(f"Gespeichert: data/spieltage/{season_folder(sel_season)}/{uploaded.name}")
 elif choice and choice != "—":
     json_path = DATA_DIR / choice
 
@@ -114,23 +144,32 @@ if json_path:
 
     if st.button("Render Spieltagsübersicht", type="primary"):
         try:
-            out_path = render_from_json_file(
-                json_path=json_path,
-                enable_draw_vs=enable_vs,
-                delta_date=delta_date_input,
-                enable_fx_on_teams=enable_team_fx,
-                header_fx="ice_noise",
+            out_str, img_bytes = _cached_render(
+                str(json_path),
+                json_path.stat().st_mtime,
+                asset_stamp(
+                    PULS_ASSETS / "templates" / "matchday_overview_v1.png",
+                    PULS_ASSETS / "logos",
+                    PULS_ASSETS / "fonts",
+                    PULS_ASSETS / "team_display_names.json",
+                ),
+                enable_vs,
+                delta_date_input,
+                enable_team_fx,
             )
-            out_path = Path(out_path)
+            # Bytes aus dem Cache wieder an den Pfad legen: gleicher Dateiname kann
+            # inzwischen von einem anderen Spieltag/einer anderen Saison belegt sein
+            out_path = Path(out_str)
+            write_bytes_if_changed(out_path, img_bytes)
+            out_name = out_path.name
 
-            st.success(f"Gerendert: {out_path.name}")
+            st.success(f"Gerendert: {out_name}")
 
-            img_bytes = out_path.read_bytes()
-            st.image(img_bytes, caption=out_path.name, use_container_width=True)
+            st.image(img_bytes, caption=out_name, use_container_width=True)
             st.download_button(
                 "PNG herunterladen",
                 data=img_bytes,
-                file_name=out_path.name,
+                file_name=out_name,
                 mime="image/png",
             )
 
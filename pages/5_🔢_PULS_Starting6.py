@@ -1,20 +1,33 @@
+import importlib.util
 import json
+import os
 import re
 from pathlib import Path
 
 import streamlit as st
 
+try:
+    import orjson  # schneller C-Parser, optional
+except ImportError:
+    orjson = None
+
+from tools._limits import RENDER_LOCK
 from tools.puls_renderer import (
     list_matchups_from_matchday_json,
     extract_starting6_for_matchup,
 )
 
+
 # optional: wenn du später den echten PNG-Renderer einbaust
-try:
+# (lazy: PIL/Fonts erst laden, wenn der Render-Teil gebraucht wird; find_spec importiert nichts)
+HAS_RENDER = importlib.util.find_spec("PIL") is not None
+
+
+@st.cache_resource(show_spinner=False)
+def _load_starting6_renderer():
+    # Importfehler werfen statt None zurückgeben -> cache_resource merkt sich keinen Fehlschlag
     from tools.puls_renderer import render_starting6_from_files
-    HAS_RENDER = True
-except Exception:
-    HAS_RENDER = False
+    return render_starting6_from_files
 
 
 st.set_page_config(page_title="Starting6 Renderer", layout="wide")
@@ -30,21 +43,25 @@ LINEUPS_ROOT   = BASE_DIR / "data" / "lineups"
 # -----------------------------
 # Helpers
 # -----------------------------
-def _load_json(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
+@st.cache_data(show_spinner=False)
+def _load_json(path_str: str, mtime: float) -> dict:
+    # mtime gehört zum Cache-Key -> neue Dateiversion wird neu geparst
+    raw = Path(path_str).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+_MATCHDAY_RX = re.compile(r"spieltag_[0-9]{2}\.json")
+_LINEUPS_RX  = re.compile(r"spieltag_[0-9]{2}_lineups\.json")
+_SPIELTAG_RX = re.compile(r"spieltag_(\d+)")
 
 def _to_index(value: str) -> int:
     m = re.search(r"(\d+)", str(value))
     return int(m.group(1)) if m else -1
 
 def _extract_spieltag_number(filename: str) -> int | None:
-    m = re.search(r"spieltag_(\d+)", filename)
-    if not m:
-        return None
-    try:
-        return int(m.group(1))
-    except Exception:
-        return None
+    m = _SPIELTAG_RX.search(filename)
+    return int(m.group(1)) if m else None
 
 def _home_away(m):
     # erlaubt: (home, away) ODER {"home":..., "away":...}
@@ -61,15 +78,35 @@ def list_seasons(root: Path) -> list[Path]:
     seasons.sort(key=lambda p: _to_index(p.name))
     return seasons
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _scan_season_dir(dir_str: str, mtime: float) -> tuple[list[str], list[str]]:
+    # ein scandir-Durchlauf, sortiert in (spieltage, lineups); mtime invalidiert bei neuen Dateien
+    matchdays: list[str] = []
+    lineups: list[str] = []
+    with os.scandir(dir_str) as it:
+        for e in it:
+            n = e.name
+            if not (n.startswith("spieltag_") and n.endswith(".json")):
+                continue
+            if _MATCHDAY_RX.fullmatch(n):
+                matchdays.append(e.path)
+            elif _LINEUPS_RX.fullmatch(n):
+                lineups.append(e.path)
+    matchdays.sort(key=lambda x: _to_index(os.path.basename(x)))
+    lineups.sort(key=lambda x: _to_index(os.path.basename(x)))
+    return matchdays, lineups
+
 def list_matchday_files(season_dir: Path) -> list[Path]:
     if not season_dir.exists():
         return []
-    return sorted(season_dir.glob("spieltag_[0-9][0-9].json"), key=lambda p: _to_index(p.name))
+    matchdays, _ = _scan_season_dir(str(season_dir), season_dir.stat().st_mtime)
+    return [Path(x) for x in matchdays]
 
 def list_lineup_files(season_dir: Path) -> list[Path]:
     if not season_dir.exists():
         return []
-    return sorted(season_dir.glob("spieltag_[0-9][0-9]_lineups.json"), key=lambda p: _to_index(p.name))
+    _, lineups = _scan_season_dir(str(season_dir), season_dir.stat().st_mtime)
+    return [Path(x) for x in lineups]
 
 
 # -----------------------------
@@ -127,14 +164,14 @@ with col2:
 
 # --- JSON laden ---
 try:
-    matchday_data = _load_json(matchday_path)
+    matchday_data = _load_json(str(matchday_path), matchday_path.stat().st_mtime)
 except Exception as e:
     st.error(f"Matchday JSON kaputt: {matchday_path.name}")
     st.exception(e)
     st.stop()
 
 try:
-    lineups_data = _load_json(lineup_path)
+    lineups_data = _load_json(str(lineup_path), lineup_path.stat().st_mtime)
 except Exception as e:
     st.error(f"Lineups JSON kaputt: {lineup_path.name}")
     st.exception(e)
@@ -202,28 +239,35 @@ else:
 
     if st.button("Render Starting6 PNG", type="primary"):
         try:
-            out_path = render_starting6_from_files(
-                matchday_json_path=matchday_path,
-                lineups_json_path=lineup_path,
-                home_team=home_team,
-                away_team=away_team,
-                template_name=template_name,
-                out_name=out_name,
-            )
+            render_starting6_from_files = _load_starting6_renderer()
+        except Exception:
+            st.info("Renderer-Funktion render_starting6_from_files ist (noch) nicht importierbar. Debug läuft aber.")
+            st.stop()
+
+        try:
+            with RENDER_LOCK:
+                out_path = render_starting6_from_files(
+                    matchday_json_path=matchday_path,
+                    lineups_json_path=lineup_path,
+                    home_team=home_team,
+                    away_team=away_team,
+                    template_name=template_name,
+                    out_name=out_name,
+                )
             out_path = Path(out_path)
             st.success(f"Gerendert: {out_path.name}")
 
-            img_bytes = out_path.read_bytes()
-
+            # Vorschau direkt vom Pfad, Download als File-Handle (kein eigenes read_bytes())
             with st.expander("Vorschau", expanded=True):
-                st.image(img_bytes, caption=out_path.name, width=520)
-
-            st.download_button(
-                "PNG herunterladen",
-                data=img_bytes,
-                file_name=out_path.name,
-                mime="image/png",
-            )
+                st.image(str(out_path), caption=out_path.name, width=520)
+
+            with out_path.open("rb") as f:
+                st.download_button(
+                    "PNG herunterladen",
+                    data=f,
+                    file_name=out_path.name,
+                    mime="image/png",
+                )
 
         except Exception as e:
             st.error("Render fehlgeschlagen.")
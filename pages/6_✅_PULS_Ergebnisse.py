@@ -9,6 +9,8 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from tools._limits import RENDER_LOCK
+
 try:
     from tools.puls_renderer import results_renderer
 except Exception as e:
@@ -84,11 +86,12 @@ if not spieltag_path.exists():
 else:
     if st.button("Render Ergebnisse", use_container_width=True):
         try:
-            out_path = results_renderer.render_from_spieltag_file(
-                spieltag_json_path=spieltag_path,
-                template_name=template_name,
-                delta_date=delta_date,
-            )
+            with RENDER_LOCK:
+                out_path = results_renderer.render_from_spieltag_file(
+                    spieltag_json_path=spieltag_path,
+                    template_name=template_name,
+                    delta_date=delta_date,
+                )
         except Exception as e:
             st.error("Render fehlgeschlagen.")
             st.code(str(e))
@@ -97,16 +100,17 @@ else:
             st.success(f"Gerendert: {out_path}")
 
             if out_path.exists():
-                st.image(str(out_path))
+                # einmal lesen, Vorschau + Download teilen sich den Puffer
+                png_bytes = out_path.read_bytes()
+                st.image(png_bytes)
                 st.code(str(out_path))
 
-                with out_path.open("rb") as f:
-                    st.download_button(
-                        "PNG herunterladen",
-                        data=f,
-                        file_name=out_path.name,
-                        mime="image/png",
-                        use_container_width=True,
-                    )
+                st.download_button(
+                    "PNG herunterladen",
+                    data=png_bytes,
+                    file_name=out_path.name,
+                    mime="image/png",
+                    use_container_width=True,
+                )
             else:
                 st.warning("Output-Datei wurde nicht gefunden, obwohl Render keinen Fehler geworfen hat.")
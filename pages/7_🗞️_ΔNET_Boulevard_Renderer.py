@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import threading
 from pathlib import Path
 import streamlit as st
 
-from tools.deltanet.boulevard import render_deltanet_boulevard, save_payload_json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash  # nicht-kryptografisch, reicht für Cache-Keys
+except ImportError:
+    xxhash = None
+
+from tools._limits import RENDER_LOCK
+from tools._render_cache import asset_stamp, write_bytes_if_changed
 from tools.deltanet.name_mapper import NameMapper
 
 
@@ -12,6 +26,51 @@ st.set_page_config(page_title="ΔNET Boulevard Renderer", layout="wide")
 def get_name_mapper() -> NameMapper:
     return NameMapper.from_repo_file()
 
+def _payload_key(payload: dict) -> str:
+    # stabiler Hash über den sortierten Payload -> Cache-Key fürs Rendering
+    if orjson is not None:
+        raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        raw = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(raw)
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_render(payload_key: str, _payload: dict, out_name: str | None, assets: tuple) -> tuple[str, bytes]:
+    # _payload wird nicht gehasht; payload_key steht stellvertretend dafür (assets: Hintergründe/Fonts-mtimes)
+    # Renderer (PIL & Co.) erst beim tatsächlichen Rendern importieren
+    from tools.deltanet.boulevard import render_deltanet_boulevard_bytes
+
+    with RENDER_LOCK:
+        out, png_bytes = render_deltanet_boulevard_bytes(_payload, out_name=out_name)
+    return str(out), png_bytes
+
+
+_TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+
+
+def _asset_stamp() -> tuple:
+    return asset_stamp(_TOOLS_DIR / "deltanet" / "data", _TOOLS_DIR / "puls_renderer" / "assets" / "fonts")
+
+
+def _warmup() -> None:
+    # Import + Cache-Füllen laufen komplett im Hintergrund-Thread, nicht im Script-Thread
+    from tools.deltanet.boulevard import warm_caches
+    warm_caches()
+
+
+@st.cache_resource(show_spinner=False)
+def _start_warmup() -> threading.Thread:
+    # einmal pro Prozess: Hintergründe + Fonts vorladen, während der User noch tippt
+    t = threading.Thread(target=_warmup, name="boulevard-warmup", daemon=True)
+    t.start()
+    return t
+
+
+_start_warmup()
+
 st.title("🗞️ ΔNET — Boulevard Renderer")
 st.markdown("### Player-Name Mapper")
 
@@ -59,68 +118,85 @@ colA, colB = st.columns([1, 1], gap="large")
 
 with colA:
     st.subheader("Inputs")
-    brand = st.text_input("Brand", value="ΔNET - Boulevard")
-    kicker = st.text_input("Kicker", value="EXKLUSIV")
-    heat = st.selectbox("Heat", ["HOT", "AMBER", "NEUTRAL"], index=0)
-
-    headline = st.text_area(
-        "Headline (kurz + brutal)",
-        value="Headline",
-        height=120
-    )
-    bg = st.selectbox(
-        "Boulevard Hintergrund",
-        ["urban", "infra", "trash", "chaos", "lifestyle", "sportnews"],
-        index=0,
-    )
-
-    teaser = st.text_area(
-        "Teaser (1–3 Zeilen, nicht Roman)",
-        value="Augenzeugen sprechen sind sich nicht einig. \n\n" 
-        "Experten sind ratlos.",
-        height=100
-    )
 
-    delta_date = st.text_input("Δ-Datum", value="Δ2125-07-19")
-    location = st.text_input("Ort / Sektor", value="IRIS · GLASS QUAY")
-
-    desk = st.text_input("Watermark / Desk", value="ΔNet · Satirische Parallelmeldungen aus dem HIGHspeed-Universum.")
-
-    payload = {
-        "brand": brand,
-        "kicker": kicker,
-        "heat": heat,
-        "headline": headline,
-        "teaser": teaser,
-        "delta_date": delta_date,
-        "location": location,
-        "desk": desk,
-        "bg": bg,  # <— DAS fehlt
-    }
-
-    render_btn = st.button("Render PNG", type="primary", use_container_width=True)
+    # Form: Tippen löst keinen Rerun aus, erst der Submit
+    with st.form("boulevard_form"):
+        brand = st.text_input("Brand", value="ΔNET - Boulevard")
+        kicker = st.text_input("Kicker", value="EXKLUSIV")
+        heat = st.selectbox("Heat", ["HOT", "AMBER", "NEUTRAL"], index=0)
+
+        headline = st.text_area(
+            "Headline (kurz + brutal)",
+            value="Headline",
+            height=120
+        )
+        bg = st.selectbox(
+            "Boulevard Hintergrund",
+            ["urban", "infra", "trash", "chaos", "lifestyle", "sportnews"],
+            index=0,
+        )
+
+        teaser = st.text_area(
+            "Teaser (1–3 Zeilen, nicht Roman)",
+            value="Augenzeugen sprechen sind sich nicht einig. \n\n" 
+            "Experten sind ratlos.",
+            height=100
+        )
+
+        delta_date = st.text_input("Δ-Datum", value="Δ2125-07-19")
+        location = st.text_input("Ort / Sektor", value="IRIS · GLASS QUAY")
+
+        desk = st.text_input("Watermark / Desk", value="ΔNet · Satirische Parallelmeldungen aus dem HIGHspeed-Universum.")
+
+        payload = {
+            "brand": brand,
+            "kicker": kicker,
+            "heat": heat,
+            "headline": headline,
+            "teaser": teaser,
+            "delta_date": delta_date,
+            "location": location,
+            "desk": desk,
+            "bg": bg,  # <— DAS fehlt
+        }
+
+        render_btn = st.form_submit_button("Render PNG", type="primary", use_container_width=True)
 
 with colB:
     st.subheader("Preview / Output")
     if render_btn:
         try:
-            out = render_deltanet_boulevard(payload, out_name=(out_name.strip() or None))
-            st.success(f"Gerendert: {out}")
-            st.image(str(out), use_container_width=True)
-
-            st.download_button(
-                "Download PNG",
-                data=out.read_bytes(),
-                file_name=out.name,
-                mime="image/png",
-                use_container_width=True
-            )
+            key = _payload_key(payload)
+            out_str, png_bytes = _cached_render(key, payload, out_name.strip() or None, _asset_stamp())
+            # bei Cache-Treffer hat dieser Aufruf nichts geschrieben -> Bytes an den Pfad legen
+            write_bytes_if_changed(Path(out_str), png_bytes)
+            name = Path(out_str).name
+            # letzter Render bleibt in der Session -> andere Widgets (Sidebar etc.)
+            # lösen einen Rerun aus, die Vorschau bleibt ohne neues Rendern stehen
+            st.session_state["boulevard_last"] = (key, name, png_bytes)
+            st.success(f"Gerendert: {name}")
 
             if save_json:
+                from tools.deltanet.boulevard import save_payload_json
+
                 jpath = save_payload_json(payload, data_dir=data_dir)
                 st.info(f"JSON gespeichert: {jpath}")
 
         except Exception as e:
+            st.session_state.pop("boulevard_last", None)
             st.error(str(e))
-    else:
+
+    last = st.session_state.get("boulevard_last")
+    if last is not None:
+        _, name, png_bytes = last
+        st.image(png_bytes, use_container_width=True)
+
+        st.download_button(
+            "Download PNG",
+            data=png_bytes,
+            file_name=name,
+            mime="image/png",
+            use_container_width=True
+        )
+    elif not render_btn:
         st.info("Links füllen → Render PNG.")
@@ -1,9 +1,23 @@
 # pages/6_🛰️_ΔNET_Headline_Renderer.py
 from __future__ import annotations
 
+import hashlib
+import json
 from pathlib import Path
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash  # nicht-kryptografisch, reicht für Cache-Keys
+except ImportError:
+    xxhash = None
+
+from tools._limits import RENDER_LOCK
+from tools._render_cache import asset_stamp, write_bytes_if_changed
 from tools.deltanet.headline import render_deltanet_headline, save_payload_json
 from tools.deltanet.name_mapper import NameMapper
 
@@ -13,6 +27,34 @@ st.set_page_config(page_title="ΔNET Headline Renderer", layout="wide")
 def get_name_mapper() -> NameMapper:
     return NameMapper.from_repo_file()
 
+def _payload_key(payload: dict) -> str:
+    # stabiler Hash über den sortierten Payload -> Cache-Key fürs Rendering
+    if orjson is not None:
+        raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        raw = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(raw)
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_render(payload_key: str, _payload: dict, out_name: str | None, assets: tuple) -> tuple[str, bytes]:
+    # _payload wird nicht gehasht; payload_key steht stellvertretend dafür (assets: Template/Fonts-mtimes)
+    with RENDER_LOCK:
+        out = render_deltanet_headline(payload=_payload, out_name=out_name)
+    return str(out), out.read_bytes()
+
+
+_TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+
+
+def _asset_stamp() -> tuple:
+    return asset_stamp(
+        _TOOLS_DIR / "deltanet" / "data" / "deltanet_headline_v1.png",
+        _TOOLS_DIR / "puls_renderer" / "assets" / "fonts",
+    )
+
 
 st.title("🛰️ ΔNET — Headline Renderer")
 
@@ -70,59 +112,65 @@ colA, colB = st.columns([1, 1], gap="large")
 with colA:
     st.subheader("Eingaben")
 
-    delta_date = st.text_input("Δ-Datum", value=default_delta_date)
-    location = st.text_input("Ort / Sektor / Trasse", value=default_location)
+    # Form: Tippen löst keinen Rerun aus, erst der Submit
+    with st.form("headline_form"):
+        delta_date = st.text_input("Δ-Datum", value=default_delta_date)
+        location = st.text_input("Ort / Sektor / Trasse", value=default_location)
 
-    status = st.selectbox("STATUS", ["UNVERIFIED", "DEVELOPING", "CONFIRMED", "CRITICAL"], index=["UNVERIFIED","DEVELOPING","CONFIRMED","CRITICAL"].index(default_status))
-    priority = st.selectbox("PRIORITY", ["AMBER", "LOW", "HIGH"], index=["AMBER","LOW","HIGH"].index(default_priority))
+        status = st.selectbox("STATUS", ["UNVERIFIED", "DEVELOPING", "CONFIRMED", "CRITICAL"], index=["UNVERIFIED","DEVELOPING","CONFIRMED","CRITICAL"].index(default_status))
+        priority = st.selectbox("PRIORITY", ["AMBER", "LOW", "HIGH"], index=["AMBER","LOW","HIGH"].index(default_priority))
 
-    headline = st.text_area(
-        "Headline (Zeilenumbrüche erlaubt)",
-        value="SPIELTAG 18 UNTERBROCHEN\nSIGNALVERLUST AUF WYND-45",
-        height=120
-    )
+        headline = st.text_area(
+            "Headline (Zeilenumbrüche erlaubt)",
+            value="SPIELTAG 18 UNTERBROCHEN\nSIGNALVERLUST AUF WYND-45",
+            height=120
+        )
 
-    subline = st.text_area(
-        "Kurztext (optional)",
-        value="Mehrere Datenfeeds brachen während der zweiten Phase ab. Eine Ursache wurde bislang nicht bestätigt.",
-        height=90
-    )
+        subline = st.text_area(
+            "Kurztext (optional)",
+            value="Mehrere Datenfeeds brachen während der zweiten Phase ab. Eine Ursache wurde bislang nicht bestätigt.",
+            height=90
+        )
 
-    source = st.text_input("Quelle (Footer)", value="ΔNet - Public Information Layer")
+        source = st.text_input("Quelle (Footer)", value="ΔNet - Public Information Layer")
 
-    payload = {
-        "delta_date": delta_date.strip(),
-        "location": location.strip(),
-        "status": status.strip(),
-        "priority": priority.strip(),
-        "headline": headline.strip(),
-        "subline": subline.strip(),
-        "source": source.strip(),
-    }
+        payload = {
+            "delta_date": delta_date.strip(),
+            "location": location.strip(),
+            "status": status.strip(),
+            "priority": priority.strip(),
+            "headline": headline.strip(),
+            "subline": subline.strip(),
+            "source": source.strip(),
+        }
 
-    st.divider()
+        st.divider()
 
-    render_btn = st.button("Render PNG", type="primary", use_container_width=True)
+        render_btn = st.form_submit_button("Render PNG", type="primary", use_container_width=True)
 
 with colB:
     st.subheader("Preview / Output")
 
     if render_btn:
         try:
-            out = render_deltanet_headline(
-                payload=payload,
-                out_name=(out_name.strip() or None),
+            out_str, png_bytes = _cached_render(
+                _payload_key(payload),
+                payload,
+                out_name.strip() or None,
+                _asset_stamp(),
             )
+            # bei Cache-Treffer hat dieser Aufruf nichts geschrieben -> Bytes an den Pfad legen
+            write_bytes_if_changed(Path(out_str), png_bytes)
+            name = Path(out_str).name
 
-            st.success(f"Gerendert: {out}")
-            st.image(str(out), use_container_width=True)
+            st.success(f"Gerendert: {name}")
+            st.image(png_bytes, use_container_width=True)
 
             # Download
-            png_bytes = out.read_bytes()
             st.download_button(
                 "Download PNG",
                 data=png_bytes,
-                file_name=out.name,
+                file_name=name,
                 mime="image/png",
                 use_container_width=True
             )
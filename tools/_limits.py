@@ -0,0 +1,11 @@
+# tools/_limits.py
+#
+# Prozessweite Limits für die Streamlit-Pages.
+# Streamlit führt jede Session in einem eigenen Thread aus; ohne Sperre laufen
+# mehrere PIL-Renders parallel und der Pi swappt. Mit RENDER_LOCK wird immer nur
+# ein Render gleichzeitig ausgeführt, weitere Klicks warten in der Schlange.
+import threading
+
+RENDER_LOCK = threading.Semaphore(1)
+
+__all__ = ["RENDER_LOCK"]
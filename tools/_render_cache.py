@@ -0,0 +1,102 @@
+# tools/_render_cache.py
+#
+# Helfer für die gecachten Renders der Streamlit-Pages.
+# st.cache_data hält die PNG-Bytes; der Pfad auf der Platte kann inzwischen von einem
+# anderen Render (gleicher Dateiname, andere Saison/Teams) überschrieben worden sein.
+# Deshalb: Asset-mtimes mit in den Cache-Key, und vor dem Anzeigen die Bytes wieder an
+# den gemeldeten Pfad schreiben (nur wenn sie dort nicht schon exakt so liegen).
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from typing import BinaryIO, Tuple
+
+_CHUNK = 1 << 20
+
+
+def asset_stamp(*paths: Path) -> Tuple[int, ...]:
+    """
+    mtime_ns pro Asset als Cache-Key-Bestandteil.
+    Datei -> eigene mtime, Ordner -> jüngste mtime der Dateien darin (nicht rekursiv),
+    fehlt -> 0.
+    """
+    out = []
+    for p in paths:
+        try:
+            st = os.stat(p)
+        except OSError:
+            out.append(0)
+            continue
+        if not os.path.isdir(p):
+            out.append(st.st_mtime_ns)
+            continue
+        newest = st.st_mtime_ns
+        with os.scandir(p) as it:
+            for e in it:
+                if e.is_file():
+                    newest = max(newest, e.stat().st_mtime_ns)
+        out.append(newest)
+    return tuple(out)
+
+
+def _same_content(path: Path, data: bytes) -> bool:
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def write_bytes_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Stellt sicher, dass `path` genau `data` enthält (atomar über .tmp + os.replace).
+    Gibt True zurück, wenn geschrieben wurde.
+    """
+    path = Path(path)
+    if _same_content(path, data):
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+
+def _stream_equals(src: BinaryIO, path: Path, size: int) -> bool:
+    try:
+        if path.stat().st_size != size:
+            return False
+        with open(path, "rb") as f:
+            while True:
+                a = src.read(_CHUNK)
+                b = f.read(_CHUNK)
+                if a != b:
+                    return False
+                if not a:
+                    return True
+    except OSError:
+        return False
+
+
+def copy_upload_if_changed(upload: BinaryIO, size: int, target: Path) -> bool:
+    """
+    Schreibt einen Upload nur dann (gestreamt, atomar) nach `target`, wenn sich der Inhalt
+    unterscheidet -> unveränderter Upload lässt die mtime stehen, Render-Caches bleiben gültig.
+    Gibt True zurück, wenn geschrieben wurde.
+    """
+    target = Path(target)
+    upload.seek(0)
+    if _stream_equals(upload, target, size):
+        return False
+
+    upload.seek(0)
+    tmp = target.with_name(target.name + ".tmp")
+    with open(tmp, "wb") as f:
+        shutil.copyfileobj(upload, f, length=_CHUNK)
+    os.replace(tmp, target)
+    return True
+
+
+__all__ = ["asset_stamp", "write_bytes_if_changed", "copy_upload_if_changed"]
@@ -1,3 +1,3 @@
-from .renderer import render_deltanet_boulevard, save_payload_json
+from .renderer import render_deltanet_boulevard, render_deltanet_boulevard_bytes, save_payload_json, warm_caches
 
-__all__ = ["render_deltanet_boulevard", "save_payload_json"]
+__all__ = ["render_deltanet_boulevard", "render_deltanet_boulevard_bytes", "save_payload_json", "warm_caches"]
@@ -3,13 +3,21 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
+import io
 import json
 import re
 import random
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
 
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    import orjson  # optional: schneller, schreibt direkt UTF-8 Bytes
+except ImportError:
+    orjson = None
+
 from .layout_config import DeltaNetBoulevardLayoutV1
 
 
@@ -53,6 +61,16 @@ BG_ALIASES = {
 
 DEFAULT_BG_KEY = "urban"
 
+# ein flaches Lookup: Alias ODER Key -> kanonischer BG_MAP-Key (Keys gewinnen vor Aliasen)
+_BG_KEYS: Dict[str, str] = {
+    **{alias: key for alias, key in BG_ALIASES.items() if key in BG_MAP},
+    **{key: key for key in BG_MAP},
+}
+
+_RE_FILENAME_BAD = re.compile(r"[^a-z0-9\-_]+")
+_RE_MULTI_DASH = re.compile(r"-{2,}")
+_RE_BG_KEY_BAD = re.compile(r"[^a-z0-9]+")
+
 
 # ----------------------------
 # Paths
@@ -89,8 +107,8 @@ def _ensure_dir(p: Path) -> None:
 
 def _sanitize_filename(s: str) -> str:
     s = (s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9\-_]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    s = _RE_FILENAME_BAD.sub("-", s)
+    s = _RE_MULTI_DASH.sub("-", s).strip("-")
     return s or "deltanet"
 
 
@@ -99,13 +117,22 @@ def save_payload_json(payload: Dict[str, Any], data_dir: Path) -> Path:
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     slug = _sanitize_filename(payload.get("headline", "")[:48])
     out = data_dir / f"{ts}_{slug}.json"
-    out.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        out.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        out.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
     return out
 
 
 # ----------------------------
 # Helpers: Text fitting / wrapping
 # ----------------------------
+@lru_cache(maxsize=256)
+def _load_font(path_str: str, size: int) -> ImageFont.FreeTypeFont:
+    # TTF einmal pro (Datei, Größe) parsen statt bei jedem Fit-Schritt
+    return ImageFont.truetype(path_str, size=size)
+
+
 def _fit_text(
     draw: ImageDraw.ImageDraw,
     text: str,
@@ -114,15 +141,44 @@ def _fit_text(
     start_size: int,
     min_size: int = 12,
 ) -> ImageFont.FreeTypeFont:
-    size = start_size
-    while size >= min_size:
-        f = ImageFont.truetype(str(font_path), size=size)
-        bbox = draw.textbbox((0, 0), text, font=f)
-        w = bbox[2] - bbox[0]
-        if w <= max_width:
-            return f
-        size -= 1
-    return ImageFont.truetype(str(font_path), size=min_size)
+    # Binärsuche: "passt" ist monoton in der Größe -> größte passende Größe in O(log n)
+    path_str = str(font_path)
+    multiline = "\n" in text
+
+    def _width(font: ImageFont.FreeTypeFont) -> float:
+        # getlength kennt keine Zeilenumbrüche (summiert alle Zeilen) -> mehrzeilig per textbbox
+        if multiline:
+            bbox = draw.textbbox((0, 0), text, font=font)
+            return bbox[2] - bbox[0]
+        return font.getlength(text)
+
+    lo, hi = min_size, start_size
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if _width(_load_font(path_str, mid)) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return _load_font(path_str, min_size if lo < min_size else lo)
+
+
+class _CharWidths(dict):
+    """Advance-Breiten pro Zeichen für EINEN Font, lazy befüllt."""
+
+    def __init__(self, font: ImageFont.FreeTypeFont):
+        super().__init__()
+        self.font = font
+
+    def __missing__(self, ch: str) -> float:
+        w = self.font.getlength(ch)
+        self[ch] = w
+        return w
+
+
+@lru_cache(maxsize=64)
+def _char_widths(font: ImageFont.FreeTypeFont) -> _CharWidths:
+    # Key ist das Font-Objekt selbst (kommt aus _load_font, also stabil)
+    return _CharWidths(font)
 
 
 def _wrap_text(
@@ -139,6 +195,12 @@ def _wrap_text(
     if not text:
         return []
 
+    # Breiten aus der Zeichen-Tabelle statt getlength pro Kandidat. Weicht nur durch
+    # Kerning minimal ab; nur im knappen Grenzbereich wird exakt gemessen.
+    widths = _char_widths(font)
+    margin = max(2.0, font.size * 0.25)
+    space_w = widths[" "]
+
     out: List[str] = []
     for raw_line in text.splitlines():
         words = raw_line.split()
@@ -146,16 +208,30 @@ def _wrap_text(
             out.append("")
             continue
 
-        cur = words[0]
-        for w in words[1:]:
-            test = f"{cur} {w}"
-            bbox = draw.textbbox((0, 0), test, font=font)
-            if (bbox[2] - bbox[0]) <= max_width:
-                cur = test
-            else:
-                out.append(cur)
-                cur = w
-        out.append(cur)
+        # Präfixsummen: ps[i] = Breite von words[:i] inkl. je einem Space dahinter,
+        # Breite von " ".join(words[s:e]) = ps[e] - ps[s] - space_w
+        ps = [0.0]
+        acc = 0.0
+        for w in words:
+            acc += sum(widths[c] for c in w) + space_w
+            ps.append(acc)
+
+        n = len(words)
+        s = 0
+        while s < n:
+            # alles bis e passt sicher (Approx. deutlich unter max_width) -> per bisect springen
+            e = bisect_right(ps, ps[s] + space_w + max_width - margin, s + 1) - 1
+            e = max(e, s + 1)  # erstes Wort einer Zeile immer nehmen
+            # Grenzbereich: Wort für Wort exakt prüfen
+            while e < n:
+                approx = ps[e + 1] - ps[s] - space_w
+                if approx > max_width + margin:
+                    break
+                if font.getlength(" ".join(words[s:e + 1])) > max_width:
+                    break
+                e += 1
+            out.append(" ".join(words[s:e]))
+            s = e
 
     return out
 
@@ -186,14 +262,21 @@ def draw_marker_lines(
     - zeichnet ein leicht "organisches" Marker-Rechteck (rechte Kante jitter)
     - zeichnet Text darüber
 
+    Alle Marker eines Blocks landen in EINEM Overlay (Union-Bbox) und werden
+    mit einem alpha_composite aufgetragen; danach kommt der Text.
+
     Gibt das y nach dem Block zurück.
     """
     rnd = random.Random(seed)
+    step = font.size + line_gap
     cy = y
 
+    # Pass 1: Zeilen-Positionen + Marker-Rechtecke sammeln
+    rects: List[Tuple[int, int, int, int]] = []
+    text_rows: List[Tuple[int, str]] = []
     for line in lines:
         if not line.strip():
-            cy += font.size + line_gap
+            cy += step
             continue
 
         bbox = draw.textbbox((x, cy), line, font=font, anchor="la")
@@ -203,20 +286,41 @@ def draw_marker_lines(
         jy1 = rnd.randint(-jitter_y, jitter_y)
         jy2 = rnd.randint(-jitter_y, jitter_y)
 
-        rect = (
+        rects.append((
             x0 - pad_x,
             y0 - pad_y + jy1,
             x1 + pad_x + jr,
             y1 + pad_y + jy2,
-        )
-
-        overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
-        od = ImageDraw.Draw(overlay)
-        od.rounded_rectangle(rect, radius=radius, fill=marker_fill)
-        img.alpha_composite(overlay)
+        ))
+        text_rows.append((cy, line))
+        cy += step
+
+    # Pass 2: ein Overlay über die Union aller Rechtecke (auf das Bild geclippt)
+    if rects:
+        ux0 = max(0, min(r[0] for r in rects))
+        uy0 = max(0, min(r[1] for r in rects))
+        ux1 = min(img.width, max(r[2] for r in rects) + 1)
+        uy1 = min(img.height, max(r[3] for r in rects) + 1)
+        if ux1 > ux0 and uy1 > uy0:
+            overlay = Image.new("RGBA", (ux1 - ux0, uy1 - uy0), (0, 0, 0, 0))
+            # ein Draw für alle Rechtecke, Methode einmal gebunden
+            rounded_rect = ImageDraw.Draw(overlay).rounded_rectangle
+            for r in rects:
+                rounded_rect(
+                    (r[0] - ux0, r[1] - uy0, r[2] - ux0, r[3] - uy0),
+                    radius=radius,
+                    fill=marker_fill,
+                )
+            if img.mode == "RGBA":
+                img.alpha_composite(overlay, dest=(ux0, uy0))
+            else:
+                # RGB-Basis: Overlay über seinen eigenen Alpha-Kanal einblenden
+                img.paste(overlay, (ux0, uy0), overlay)
 
-        draw.text((x, cy), line, font=font, fill=text_fill, anchor="la")
-        cy += font.size + line_gap
+    # Pass 3: Text über die Marker
+    draw_text = draw.text
+    for ty, line in text_rows:
+        draw_text((x, ty), line, font=font, fill=text_fill, anchor="la")
 
     return cy
 
@@ -233,27 +337,34 @@ def _fit_headline_font_then_wrap(
     Wichtig: erst Fontgröße finden, dann mit dieser Fontgröße wrappen.
     Sonst ist dein Wrapping inkonsistent.
     """
-    size = start_size
-    best_font = ImageFont.truetype(str(font_path), size=min_size)
+    path_str = str(font_path)
 
-    while size >= min_size:
-        f = ImageFont.truetype(str(font_path), size=size)
+    def _try(size: int) -> Optional[List[str]]:
+        f = _load_font(path_str, size)
         lines = _wrap_text(draw, text, f, max_width)
-
-        ok = True
         for line in lines:
-            bbox = draw.textbbox((0, 0), line, font=f)
-            if (bbox[2] - bbox[0]) > max_width:
-                ok = False
-                break
-
-        if ok:
-            best_font = f
-            return best_font, lines
-
-        size -= 2
+            if f.getlength(line) > max_width:
+                return None
+        return lines
+
+    # Binärsuche über das 2er-Raster start_size, start_size-2, ... >= min_size
+    # (k = Schritte nach unten; kleinstes k, das passt = größte passende Größe)
+    lo, hi = 0, (start_size - min_size) // 2 + 1
+    best: Optional[Tuple[int, List[str]]] = None
+    while lo < hi:
+        k = (lo + hi) // 2
+        lines = _try(start_size - 2 * k)
+        if lines is not None:
+            best = (k, lines)
+            hi = k
+        else:
+            lo = k + 1
+
+    if best is not None and best[0] == lo:
+        return _load_font(path_str, start_size - 2 * lo), best[1]
 
     # fallback
+    best_font = _load_font(path_str, min_size)
     lines = _wrap_text(draw, text, best_font, max_width)
     return best_font, lines
 
@@ -262,13 +373,23 @@ def _resolve_bg_key(raw: Any) -> str:
     k = (raw or "").strip().lower()
     if not k:
         return DEFAULT_BG_KEY
-    if k in BG_MAP:
-        return k
-    if k in BG_ALIASES:
-        return BG_ALIASES[k]
-    # letzte chance: sanitize (z.B. "Lifestyle & Konsum" -> "lifestyle-konsum" -> maybe alias fehlt)
-    k2 = re.sub(r"[^a-z0-9]+", "_", k).strip("_")
-    return BG_ALIASES.get(k2, BG_MAP.get(k2, DEFAULT_BG_KEY) if k2 in BG_MAP else DEFAULT_BG_KEY)
+    hit = _BG_KEYS.get(k)
+    if hit:
+        return hit
+    # letzte chance: sanitize (z.B. "Sport News" -> "sport_news")
+    return _BG_KEYS.get(_RE_BG_KEY_BAD.sub("_", k).strip("_"), DEFAULT_BG_KEY)
+
+
+@lru_cache(maxsize=8)
+def _load_bg(path_str: str, mtime_ns: int) -> Image.Image:
+    # dekodierter Hintergrund pro (Datei, mtime); Aufrufer bekommt immer eine Kopie.
+    # Komplett deckende Hintergründe werden als RGB gehalten (kein Alpha-Kanal,
+    # der ohnehin überall 255 wäre) -> weniger Bytes pro Draw/Composite.
+    with Image.open(path_str) as im:
+        rgba = im.convert("RGBA")
+    if rgba.getchannel("A").getextrema()[0] == 255:
+        return rgba.convert("RGB")
+    return rgba
 
 
 def _pick_background_path(paths: BoulevardPaths, payload: Dict[str, Any]) -> Path:
@@ -288,10 +409,52 @@ def _pick_background_path(paths: BoulevardPaths, payload: Dict[str, Any]) -> Pat
     )
 
 
+# ----------------------------
+# Cache-Warmup
+# ----------------------------
+def warm_caches() -> None:
+    """
+    Füllt Hintergrund- und Font-Cache vorab (z.B. im Hintergrund-Thread beim
+    Laden der Page), damit der erste Render nicht PNG-Decode + TTF-Parse zahlt.
+    """
+    layout = DeltaNetBoulevardLayoutV1()
+    paths = BoulevardPaths(tools_dir=Path(__file__).resolve().parents[2])
+
+    for bg_file in dict.fromkeys(BG_MAP.values()):
+        p = paths.data_dir / bg_file
+        if p.exists():
+            _load_bg(str(p), p.stat().st_mtime_ns)
+
+    font_bold = str(paths.fonts_dir / "Inter-Bold.ttf")
+    font_med = str(paths.fonts_dir / "Inter-Medium.ttf")
+    for path_str, size in (
+        (font_bold, getattr(layout, "kicker_size", 72)),
+        (font_bold, getattr(layout, "headline_size", 88)),
+        (font_med, getattr(layout, "brand_size", 24)),
+        (font_med, getattr(layout, "teaser_size", 26)),
+        (font_med, getattr(layout, "meta_size", 22)),
+        (font_med, getattr(layout, "watermark_size", 20)),
+    ):
+        if Path(path_str).exists():
+            _load_font(path_str, size)
+
+
 # ----------------------------
 # Renderer
 # ----------------------------
 def render_deltanet_boulevard(payload: Dict[str, Any], out_name: Optional[str] = None) -> Path:
+    out_path, _ = render_deltanet_boulevard_bytes(payload, out_name=out_name)
+    return out_path
+
+
+def render_deltanet_boulevard_bytes(
+    payload: Dict[str, Any],
+    out_name: Optional[str] = None,
+) -> Tuple[Path, bytes]:
+    """
+    Wie render_deltanet_boulevard, gibt aber zusätzlich die PNG-Bytes zurück.
+    Es wird nur einmal encodiert; die Datei bekommt genau diese Bytes.
+    """
     layout = DeltaNetBoulevardLayoutV1()
 
     tools_dir = Path(__file__).resolve().parents[2]  # .../tools
@@ -310,7 +473,7 @@ def render_deltanet_boulevard(payload: Dict[str, Any], out_name: Optional[str] =
     # Background aus Dropdown-Key laden
     bg_path = _pick_background_path(paths, payload)
 
-    img = Image.open(bg_path).convert("RGBA")
+    img = _load_bg(str(bg_path), bg_path.stat().st_mtime_ns).copy()
     draw = ImageDraw.Draw(img)
 
     font_bold = paths.fonts_dir / "Inter-Bold.ttf"
@@ -321,9 +484,10 @@ def render_deltanet_boulevard(payload: Dict[str, Any], out_name: Optional[str] =
     max_w = getattr(layout, "right", img.width - 80) - getattr(layout, "left", 80)
 
     # Payload
-    brand = (payload.get("brand") or "ΔNET - Boulevard").strip()
-    kicker = (payload.get("kicker") or "EXKLUSIV").strip()
-    headline = (payload.get("headline") or "").strip()
+    # Großschreibung einmal hier, nicht an jeder Fit-/Draw-Stelle
+    brand = (payload.get("brand") or "ΔNET - Boulevard").strip().upper()
+    kicker = (payload.get("kicker") or "EXKLUSIV").strip().upper()
+    headline = (payload.get("headline") or "").strip().upper()
     teaser = (payload.get("teaser") or "").strip()
 
     delta_date = (payload.get("delta_date") or payload.get("date") or "").strip()
@@ -361,13 +525,13 @@ def render_deltanet_boulevard(payload: Dict[str, Any], out_name: Optional[str] =
 
     # BRAND (small) — safe fallback statt layout.brand_size crash
     brand_size = getattr(layout, "brand_size", 24)
-    f_brand = _fit_text(draw, brand.upper(), font_med, max_w, start_size=brand_size, min_size=16)
-    draw.text((left, y_brand), brand.upper(), font=f_brand, fill=color_muted, anchor="la")
+    f_brand = _fit_text(draw, brand, font_med, max_w, start_size=brand_size, min_size=16)
+    draw.text((left, y_brand), brand, font=f_brand, fill=color_muted, anchor="la")
 
     # KICKER (Marker + Text)
     kicker_size = getattr(layout, "kicker_size", 72)
-    f_kicker = _fit_text(draw, kicker.upper(), font_bold, max_w, start_size=kicker_size, min_size=22)
-    kicker_lines = [kicker.upper()]
+    f_kicker = _fit_text(draw, kicker, font_bold, max_w, start_size=kicker_size, min_size=22)
+    kicker_lines = [kicker]
 
     draw_marker_lines(
         img, draw,
@@ -387,14 +551,13 @@ def render_deltanet_boulevard(payload: Dict[str, Any], out_name: Optional[str] =
     )
 
     # HEADLINE (Marker + Text)
-    headline_text = headline.upper()
     headline_size = getattr(layout, "headline_size", 88)
     headline_min_size = getattr(layout, "headline_min_size", 54)
 
     f_head, head_lines = _fit_headline_font_then_wrap(
         draw=draw,
         font_path=font_bold,
-        text=headline_text,
+        text=headline,
         max_width=max_w,
         start_size=headline_size,
         min_size=headline_min_size,
@@ -423,10 +586,18 @@ def render_deltanet_boulevard(payload: Dict[str, Any], out_name: Optional[str] =
         f_teaser = _fit_text(draw, teaser, font_med, max_w, start_size=teaser_size, min_size=18)
         teaser_lines = _wrap_text(draw, teaser, f_teaser, max_w)
 
-        y = y_teaser
-        for line in teaser_lines:
-            draw.text((left, y), line, font=f_teaser, fill=color_teaser, anchor="la")
-            y += f_teaser.size + teaser_gap
+        # ein multiline_text-Aufruf statt draw.text pro Zeile. Pillow setzt den
+        # Zeilenabstand als textbbox("A")[3] + spacing -> spacing so wählen, dass
+        # der Vorschub wie bisher size + teaser_gap ist.
+        spacing = f_teaser.size + teaser_gap - draw.textbbox((0, 0), "A", font=f_teaser)[3]
+        draw.multiline_text(
+            (left, y_teaser),
+            "\n".join(teaser_lines),
+            font=f_teaser,
+            fill=color_teaser,
+            anchor="la",
+            spacing=spacing,
+        )
 
     # META bottom-left (Datum | Ort)
     meta_size = getattr(layout, "meta_size", 22)
@@ -441,7 +612,7 @@ def render_deltanet_boulevard(payload: Dict[str, Any], out_name: Optional[str] =
     meta = "  |  ".join(meta_parts)
 
     if meta:
-        f_meta = ImageFont.truetype(str(font_med), size=meta_size)
+        f_meta = _load_font(str(font_med), meta_size)
         draw.text((x_meta_left, y_meta), meta, font=f_meta, fill=color_muted, anchor="la")
 
     # DESK bottom-right
@@ -449,8 +620,12 @@ def render_deltanet_boulevard(payload: Dict[str, Any], out_name: Optional[str] =
     x_watermark = getattr(layout, "x_watermark", img.width - 80)
     y_watermark = getattr(layout, "y_watermark", img.height - 80)
 
-    f_wm = ImageFont.truetype(str(font_med), size=watermark_size)
+    f_wm = _load_font(str(font_med), watermark_size)
     draw.text((x_watermark, y_watermark), desk, font=f_wm, fill=color_muted, anchor="rd")
 
-    img.save(out_path)
-    return out_path
+    # compress_level=1: deutlich schneller als zlib-Default 6, Datei nur etwas größer
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", compress_level=1)
+    png_bytes = buf.getvalue()
+    out_path.write_bytes(png_bytes)
+    return out_path, png_bytes
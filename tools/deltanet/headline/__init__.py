@@ -1,4 +1,4 @@
 # tools/deltanet/headline/__init__.py
-from .renderer import render_deltanet_headline, save_payload_json
+from .renderer import render_deltanet_headline, render_deltanet_headlines, save_payload_json
 
-__all__ = ["render_deltanet_headline", "save_payload_json"]
+__all__ = ["render_deltanet_headline", "render_deltanet_headlines", "save_payload_json"]
@@ -3,10 +3,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 import json
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -30,20 +34,61 @@ class DeltaNetPaths:
         return self.tools_dir / "deltanet" / "headline" / "output"
 
 
+_RE_FILENAME_BAD = re.compile(r"[^a-z0-9\-_]+")
+_RE_MULTI_DASH = re.compile(r"-{2,}")
+
+# Layout, Pfade und Font-Dateien sind pro Prozess konstant -> einmal beim Import bilden
+_LAYOUT = DeltaNetHeadlineLayoutV1()
+_PATHS = DeltaNetPaths(tools_dir=Path(__file__).resolve().parents[2])  # .../tools
+_TEMPLATE_PATH = _PATHS.template_path
+_OUTPUT_DIR = _PATHS.output_dir
+_FONTS_DIR = _PATHS.fonts_dir
+_FONT_BOLD = str(_FONTS_DIR / "Inter-Bold.ttf")
+_FONT_MED = str(_FONTS_DIR / "Inter-Medium.ttf")
+
+
 def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
-def _fit_text(draw: ImageDraw.ImageDraw, text: str, font_path: Path, max_width: int, start_size: int, min_size: int = 12) -> ImageFont.FreeTypeFont:
-    size = start_size
-    while size >= min_size:
-        f = ImageFont.truetype(str(font_path), size=size)
-        bbox = draw.textbbox((0, 0), text, font=f)
-        w = bbox[2] - bbox[0]
-        if w <= max_width:
-            return f
-        size -= 1
-    return ImageFont.truetype(str(font_path), size=min_size)
+@lru_cache(maxsize=1)
+def _bootstrap() -> None:
+    # Existenz-Checks einmal pro Prozess (beim ersten Render, nicht beim Import der Page)
+    if not _TEMPLATE_PATH.exists():
+        raise FileNotFoundError(f"Template not found: {_TEMPLATE_PATH}")
+
+    if not Path(_FONT_BOLD).exists() or not Path(_FONT_MED).exists():
+        raise FileNotFoundError(f"Fonts not found. Expected in: {_FONTS_DIR}")
+
+
+@lru_cache(maxsize=4)
+def _load_template(path_str: str, mtime_ns: int) -> Image.Image:
+    # dekodiertes Template pro (Datei, mtime); Aufrufer bekommt immer eine Kopie.
+    # Komplett deckendes Template als RGB: Text wird dann direkt in 3 Kanäle geblendet,
+    # ohne Alpha-Kanal, der ohnehin überall 255 bliebe (gleiche Pixel, weniger Bytes)
+    with Image.open(path_str) as im:
+        rgba = im.convert("RGBA")
+    if rgba.getchannel("A").getextrema()[0] == 255:
+        return rgba.convert("RGB")
+    return rgba
+
+
+@lru_cache(maxsize=256)
+def _load_font(path_str: str, size: int) -> ImageFont.FreeTypeFont:
+    # TTF einmal pro (Datei, Größe) parsen statt bei jedem Fit-Schritt
+    return ImageFont.truetype(path_str, size=size)
+
+
+def _fit_text(draw: ImageDraw.ImageDraw, text: str, path_str: str, max_width: int, start_size: int, min_size: int = 12) -> ImageFont.FreeTypeFont:
+    # Binärsuche: Textbreite wächst monoton mit der Größe -> ~log2(Spanne) Messungen
+    lo, hi = min_size, start_size
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if draw.textlength(text, font=_load_font(path_str, mid)) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return _load_font(path_str, lo)
 
 
 def _wrap_text(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> str:
@@ -52,6 +97,7 @@ def _wrap_text(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFon
     if not text:
         return ""
 
+    space_w = font.getlength(" ")
     lines = []
     for raw_line in text.splitlines():
         words = raw_line.split()
@@ -59,38 +105,57 @@ def _wrap_text(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFon
             lines.append("")
             continue
 
-        cur = words[0]
-        for w in words[1:]:
-            test = f"{cur} {w}"
-            bbox = draw.textbbox((0, 0), test, font=font)
-            width = bbox[2] - bbox[0]
-            if width <= max_width:
-                cur = test
+        # Wortbreiten einmal messen, dann nur noch aufaddieren (statt Präfix-Re-Layout)
+        widths = [font.getlength(w) for w in words]
+        cur = [words[0]]
+        cur_w = widths[0]
+        for w, w_px in zip(words[1:], widths[1:]):
+            if cur_w + space_w + w_px <= max_width:
+                cur.append(w)
+                cur_w += space_w + w_px
             else:
-                lines.append(cur)
-                cur = w
-        lines.append(cur)
+                lines.append(" ".join(cur))
+                cur = [w]
+                cur_w = w_px
+        lines.append(" ".join(cur))
 
     return "\n".join(lines)
 
 
-def _status_color(layout: DeltaNetHeadlineLayoutV1, status: str) -> Tuple[int, int, int, int]:
-    s = (status or "").upper().strip()
-    if s in ("CRITICAL", "BREAK", "ALERT"):
-        return layout.color_red
-    if s in ("UNVERIFIED", "DEVELOPING", "AMBER"):
-        return layout.color_amber
-    return layout.color_muted
-
-
+def _draw_text_block(
+    img: Image.Image,
+    items: List[Tuple[int, int, str, str]],
+    font: ImageFont.FreeTypeFont,
+    fill: Tuple[int, int, int, int],
+) -> None:
+    # Mehrere Zeilen gleicher Farbe/Font erst in eine L-Maske zeichnen, dann ein einziges paste
+    # items: (x, y, text, anchor)
+    if not items:
+        return
+    ascent, descent = font.getmetrics()
+    line_h = ascent + descent
+    top = max(0, min(y for _, y, _, _ in items) - line_h)
+    bottom = min(img.height, max(y for _, y, _, _ in items) + line_h)
+    if bottom <= top:
+        return
+
+    mask = Image.new("L", (img.width, bottom - top), 0)
+    mdraw = ImageDraw.Draw(mask)
+    for x, y, text, anchor in items:
+        mdraw.text((x, y - top), text, font=font, fill=255, anchor=anchor)
+    img.paste(fill, (0, top, img.width, bottom), mask)
+
+
+@lru_cache(maxsize=256)
 def _sanitize_filename(s: str) -> str:
     s = (s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9\-_]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    s = _RE_FILENAME_BAD.sub("-", s)
+    s = _RE_MULTI_DASH.sub("-", s).strip("-")
     return s or "deltanet"
 
 
 def save_payload_json(payload: Dict[str, Any], data_dir: Path) -> Path:
+    # mkdir bei jedem Schreiben: billig, und ein zur Laufzeit gelöschter Ordner wird neu angelegt
     _ensure_dir(data_dir)
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     slug = _sanitize_filename(payload.get("headline", "")[:48])
@@ -99,10 +164,20 @@ def save_payload_json(payload: Dict[str, Any], data_dir: Path) -> Path:
     return out
 
 
+def _default_out_name(payload: Dict[str, Any], ts: Optional[str] = None, index: Optional[int] = None) -> str:
+    ts = ts or datetime.now().strftime("%Y%m%d_%H%M%S")
+    slug = _sanitize_filename(payload.get("headline", "")[:48])
+    if index is not None:
+        # Batch: gleiche Sekunde + gleicher Slug -> Index hält die Dateinamen eindeutig
+        return f"deltanet_headline_{ts}_{index:03d}_{slug}.png"
+    return f"deltanet_headline_{ts}_{slug}.png"
+
+
 def render_deltanet_headline(
     payload: Dict[str, Any],
     out_name: Optional[str] = None,
     template_path: Optional[Path] = None,
+    optimize: bool = False,
 ) -> Path:
     """
     DeltaNet Headline Renderer (Authoring-Usecase)
@@ -114,152 +189,108 @@ def render_deltanet_headline(
       - headline (str)      (can contain \\n)
       - subline (str)       optional
       - source (str)        optional
+    optimize=True: PNG mit voller Kompression (finaler Export), sonst schnelles compress_level=1
     """
-    layout = DeltaNetHeadlineLayoutV1()
+    layout = _LAYOUT
 
-    tools_dir = Path(__file__).resolve().parents[2]  # .../tools
-    paths = DeltaNetPaths(tools_dir=tools_dir)
+    _bootstrap()
 
-    tpath = template_path or paths.template_path
-    if not tpath.exists():
+    tpath = template_path or _TEMPLATE_PATH
+    if template_path is not None and not tpath.exists():
         raise FileNotFoundError(f"Template not found: {tpath}")
 
-    _ensure_dir(paths.output_dir)
-
     # Output name
     if out_name is None:
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        slug = _sanitize_filename(payload.get("headline", "")[:48])
-        out_name = f"deltanet_headline_{ts}_{slug}.png"
+        out_name = _default_out_name(payload)
 
-    out_path = paths.output_dir / out_name
+    out_path = _OUTPUT_DIR / out_name
 
-    img = Image.open(tpath).convert("RGBA")
+    img = _load_template(str(tpath), tpath.stat().st_mtime_ns).copy()
     draw = ImageDraw.Draw(img)
 
-    font_bold = paths.fonts_dir / "Inter-Bold.ttf"
-    font_med = paths.fonts_dir / "Inter-Medium.ttf"
-
-    if not font_bold.exists() or not font_med.exists():
-        raise FileNotFoundError(f"Fonts not found. Expected in: {paths.fonts_dir}")
-
     # --- Read payload ---
-    delta_date = str(payload.get("delta_date", "")).strip()
-    location = str(payload.get("location", "")).strip()
-    status = str(payload.get("status", "")).strip().upper()
-    priority = str(payload.get("priority", "")).strip().upper()
+    # Meta-Felder einmal lesen (gleiche Fallback-Kette wie die untere Meta-Zeile)
+    meta = {
+        "date": (payload.get("date") or payload.get("delta_date") or payload.get("datum") or "").strip(),
+        "location": payload.get("location", "").strip(),
+        "status": payload.get("status", "").strip().upper(),
+        "priority": payload.get("priority", "").strip().upper(),
+    }
 
     headline = str(payload.get("headline", "")).strip()
     subline = str(payload.get("subline", "")).strip()
-    source = str(payload.get("source", "ΔNet Aggregation Node")).strip()
 
-    # --- Meta block ---
     meta_max_w = layout.content_right - layout.content_left
-    meta_font = ImageFont.truetype(str(font_med), size=layout.meta_size)
-
-    # Meta lines: wir halten das bewusst kompakt
-    meta_lines = [
-        delta_date,
-        location,
-        f"STATUS: {status}" if status else "",
-        f"PRIORITY: {priority}" if priority else "",
-    ]
-    meta_lines = [l for l in meta_lines if l]
-
 
     # --- Headline (wrap + fit) ---
     head_max_w = meta_max_w
     # erst mit Startfont messen, dann ggf. wrap
-    head_font = ImageFont.truetype(str(font_bold), size=layout.headline_size)
+    head_font = _load_font(_FONT_BOLD, layout.headline_size)
     headline_wrapped = headline
 
     # Wenn kein \n drin ist, erlauben wir auto-wrap
     if "\n" not in headline_wrapped:
         headline_wrapped = _wrap_text(draw, headline_wrapped, head_font, head_max_w)
 
-    # Fit: wir rechnen auf Basis der längsten Zeile
-    longest = max((len(l) for l in headline_wrapped.splitlines()), default=0)
     # Fit anhand tatsächlicher Pixelbreite je Zeile
     # -> wir nehmen max der Zeilenbreiten
-    def _max_line_px(fnt: ImageFont.FreeTypeFont) -> int:
-        mx = 0
-        for l in headline_wrapped.splitlines():
-            bbox = draw.textbbox((0, 0), l, font=fnt)
-            mx = max(mx, bbox[2] - bbox[0])
-        return mx
-
-    size = layout.headline_size
-    while size >= 44:
-        f = ImageFont.truetype(str(font_bold), size=size)
-        if _max_line_px(f) <= head_max_w:
-            head_font = f
-            break
-        size -= 1
+    head_lines = headline_wrapped.splitlines()
+
+    def _max_line_px(fnt: ImageFont.FreeTypeFont) -> float:
+        return max((draw.textlength(l, font=fnt) for l in head_lines), default=0)
+
+    # Binärsuche über [44, headline_size]; passt nicht mal 44, bleibt der Startfont
+    lo, hi = 44, layout.headline_size
+    if _max_line_px(_load_font(_FONT_BOLD, lo)) <= head_max_w:
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if _max_line_px(_load_font(_FONT_BOLD, mid)) <= head_max_w:
+                lo = mid
+            else:
+                hi = mid - 1
+        head_font = _load_font(_FONT_BOLD, lo)
 
     y = layout.y_headline_top
-    for line in headline_wrapped.splitlines():
-        draw.text((layout.content_left, y), line.upper(), font=head_font, fill=layout.color_text, anchor="la")
+    head_items = []
+    for line in head_lines:
+        head_items.append((layout.content_left, y, line.upper(), "la"))
         y += (head_font.size + layout.headline_line_gap)
+    _draw_text_block(img, head_items, head_font, layout.color_text)
 
     # --- Subline (optional) ---
     if subline:
         sub_max_w = meta_max_w
-        sub_font = _fit_text(draw, subline, font_med, max_width=sub_max_w, start_size=layout.subline_size, min_size=20)
+        sub_font = _fit_text(draw, subline, _FONT_MED, max_width=sub_max_w, start_size=layout.subline_size, min_size=20)
         sub_wrapped = _wrap_text(draw, subline, sub_font, sub_max_w)
 
         y = layout.y_subline_top
+        sub_items = []
         for line in sub_wrapped.splitlines():
-            draw.text((layout.content_left, y), line, font=sub_font, fill=layout.color_muted, anchor="la")
+            sub_items.append((layout.content_left, y, line, "la"))
             y += (sub_font.size + layout.subline_line_gap)
+        _draw_text_block(img, sub_items, sub_font, layout.color_muted)
 
-    # --- Footer/source ---
-    foot = source
-        # --- Bottom Meta Row: date | location | status ---
-    delta_date = (
-    payload.get("date")
-    or payload.get("delta_date")
-    or payload.get("datum")
-    or ""
-).strip()
-
-    location   = payload.get("location", "").strip()
-
-    status = payload.get("status", "").strip()
-    if status:
-        status_text = f"STATUS: {status.upper()}"
-    else:
-        status_text = ""
+    # --- Bottom Meta Row: date | location | status ---
+    status = meta["status"]
+    status_text = f"STATUS: {status}" if status else ""
 
-    font_med_path = paths.fonts_dir / "Inter-Medium.ttf"
-    meta_font = ImageFont.truetype(str(font_med_path), size=layout.meta_size)
+    meta_font = _load_font(_FONT_MED, layout.meta_size)
 
     y = layout.y_meta_row
 
-    # date (muted)
-    if delta_date:
-        draw.text(
-            (layout.x_date, y),
-            delta_date,
-            font=meta_font,
-            fill=layout.color_muted,
-            anchor="lm",
-        )
-
-    # location (muted)
-    if location:
-        draw.text(
-            (layout.x_location, y),
-            location.upper(),
-            font=meta_font,
-            fill=layout.color_muted,
-            anchor="lm",
-        )
+    # date + location (beide muted) -> ein Block
+    muted_items = []
+    if meta["date"]:
+        muted_items.append((layout.x_date, y, meta["date"], "lm"))
+    if meta["location"]:
+        muted_items.append((layout.x_location, y, meta["location"].upper(), "lm"))
+    _draw_text_block(img, muted_items, meta_font, layout.color_muted)
 
     # status (amber/red/text)
     status_fill = layout.color_text
-    if status.upper() in {"UNVERIFIED", "AMBER", "WARNING"}:
+    if status in {"UNVERIFIED", "AMBER", "WARNING"}:
         status_fill = layout.color_amber
-    elif status.upper() in {"CRITICAL", "BREAK", "ALERT"}:
+    elif status in {"CRITICAL", "BREAK", "ALERT"}:
         status_fill = layout.color_red
 
     if status_text:
@@ -272,24 +303,20 @@ def render_deltanet_headline(
         )
 
     # optional priority under status (small, same x)
-    priority = payload.get("priority", "").strip()
-    if priority:
-        pr_font = ImageFont.truetype(str(font_med_path), size=max(16, layout.meta_size - 8))
+    if meta["priority"]:
+        pr_font = _load_font(_FONT_MED, max(16, layout.meta_size - 8))
         draw.text(
             (layout.x_priority, layout.y_priority),
-            f"PRIORITY: {priority.upper()}",
+            f"PRIORITY: {meta['priority']}",
             font=pr_font,
             fill=layout.color_amber,
             anchor="lm",
         )
 
-        # --- Watermark / Source (bottom-right) ---
+    # --- Watermark / Source (bottom-right) ---
     watermark = payload.get("source", "ΔNet Core Feed")
 
-    wm_font = ImageFont.truetype(
-        str(font_med),
-        size=layout.watermark_size
-    )
+    wm_font = _load_font(_FONT_MED, layout.watermark_size)
 
     draw.text(
         (layout.x_watermark, layout.y_watermark),
@@ -300,12 +327,36 @@ def render_deltanet_headline(
     )
 
 
-    img.save(out_path)
+    _ensure_dir(_OUTPUT_DIR)
+    # Authoring-Output wird oft neu erzeugt -> schnelles Deflate; optimize=True für finale Exporte
+    if optimize:
+        img.save(out_path, format="PNG", optimize=True)
+    else:
+        img.save(out_path, format="PNG", compress_level=1)
     return out_path
 
-# ---- compatibility alias ----
-# falls die Funktion anders heißt:
-render_deltanet_headline = render_deltanet_headline  # nur wenn sie schon genauso heißt
 
-# Beispiel, wenn sie render_headline heißt:
-# render_deltanet_headline = render_headline
+def render_deltanet_headlines(
+    payloads: List[Dict[str, Any]],
+    *,
+    workers: Optional[int] = None,
+) -> List[Path]:
+    """
+    Batch-Variante für Authoring (z.B. Newsletter): rendert jede Payload in einem
+    eigenen Prozess. Jeder Worker hält seine eigenen Font-/Template-Caches.
+    Reihenfolge der Rückgabe = Reihenfolge der Payloads; Dateinamen bekommen einen
+    Index, damit gleiche Headlines in derselben Sekunde sich nicht überschreiben.
+    """
+    if not payloads:
+        return []
+
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    out_names = [_default_out_name(p, ts=ts, index=i) for i, p in enumerate(payloads)]
+    if len(payloads) == 1:
+        return [render_deltanet_headline(payloads[0], out_names[0])]
+
+    # spawn statt fork: kein Erben von Streamlit-Threads/Locks aus dem App-Prozess
+    max_workers = min(workers or os.cpu_count() or 1, len(payloads))
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx) as ex:
+        return list(ex.map(render_deltanet_headline, payloads, out_names, chunksize=4))
@@ -1,26 +1,53 @@
 from __future__ import annotations
 
+import heapq
 import json
 import re
+from collections import Counter
 import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import difflib
 
+try:
+    # optional: C++-Scorer, gleiche Ratio-Semantik wie difflib, nur deutlich schneller
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
 
+try:
+    # optional: Aho-Corasick-Automat (C), ein linearer Scan unabhängig von der Anzahl Namen
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_RE_WORD_CHAR = re.compile(r"\w")
+_RE_WS = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=8192)
 def _normalize(s: str) -> str:
     if s is None:
         return ""
     s = s.strip()
-    s = re.sub(r"\s+", " ", s)
+    s = _RE_WS.sub(" ", s)
     s = s.casefold()
+    if s.isascii():
+        # ASCII hat nichts zu zerlegen und keine Kombinationszeichen
+        return s
     s = unicodedata.normalize("NFKD", s)
     s = "".join(ch for ch in s if not unicodedata.combining(ch))
     return s
 
 
+def _skip_bigrams(s: str) -> frozenset:
+    # 0- und 1-Skip-Bigramme: "abcd" -> ab, ac, bc, bd, cd
+    return frozenset(s[i] + s[j] for i in range(len(s)) for j in range(i + 1, min(i + 3, len(s))))
+
+
 @dataclass
 class NameMatch:
     real: Optional[str]
@@ -42,9 +69,29 @@ class NameMapper:
             self.real_to_fake[real] = fake
             self._norm_real_index[_normalize(real)] = real
 
+        # Vorfilter für lookup_fake: Skip-Bigramme pro normalisiertem Namen + invertierter Index
+        self._norm_keys: List[str] = list(self._norm_real_index.keys())
+        self._key_bigram_count: List[int] = []
+        self._bigram_index: Dict[str, List[int]] = {}
+        for idx, k in enumerate(self._norm_keys):
+            grams = _skip_bigrams(k)
+            self._key_bigram_count.append(len(grams))
+            for g in grams:
+                self._bigram_index.setdefault(g, []).append(idx)
+
         self._real_names_sorted = sorted(self.real_to_fake.keys(), key=len, reverse=True)
-        escaped = [re.escape(n) for n in self._real_names_sorted]
-        self._replace_pattern = re.compile(r"(?<!\w)(" + "|".join(escaped) + r")(?!\w)")
+        self._automaton = None
+        self._replace_pattern: Optional[re.Pattern] = None
+        if ahocorasick is not None and self.real_to_fake:
+            ac = ahocorasick.Automaton()
+            for real, fake in self.real_to_fake.items():
+                ac.add_word(real, (len(real), fake))
+            ac.make_automaton()
+            self._automaton = ac
+        elif self._real_names_sorted:
+            escaped = [re.escape(n) for n in self._real_names_sorted]
+            # eine Alternation für alle Namen (längste zuerst) -> ein Scan über den Text
+            self._replace_pattern = re.compile(r"(?<!\w)(?:" + "|".join(escaped) + r")(?!\w)")
 
     @classmethod
     def from_repo_file(cls) -> "NameMapper":
@@ -66,15 +113,32 @@ class NameMapper:
         if original_real:
             return NameMatch(real=original_real, fake=self.real_to_fake.get(original_real), confidence=1.0, suggestions=[])
 
-        # suggest
-        keys = list(self._norm_real_index.keys())
-        close = difflib.get_close_matches(q, keys, n=suggest_n, cutoff=0.6)
+        # suggest: erst billig per Skip-Bigramm-Jaccard auf Top-K eingrenzen, dann fuzzy ranken
+        keys = self._candidates(q)
+        scored: List[Tuple[str, float]]
+        if process is not None:
+            # fuzz.ratio (0..100) statt WRatio, damit confidence wie bisher 0..1 Ratio bleibt
+            scored = [
+                (k, score / 100.0)
+                for k, score, _ in process.extract(q, keys, scorer=fuzz.ratio, limit=suggest_n, score_cutoff=60)
+            ]
+        else:
+            # wie get_close_matches, aber die Ratio direkt mitnehmen (kein zweiter SequenceMatcher-Lauf)
+            sm = difflib.SequenceMatcher()
+            sm.set_seq2(q)
+            hits: List[Tuple[float, str]] = []
+            for k in keys:
+                sm.set_seq1(k)
+                if sm.real_quick_ratio() >= 0.6 and sm.quick_ratio() >= 0.6:
+                    ratio = sm.ratio()
+                    if ratio >= 0.6:
+                        hits.append((ratio, k))
+            scored = [(k, ratio) for ratio, k in heapq.nlargest(suggest_n, hits)]
 
         suggestions: List[Tuple[str, str, float]] = []
-        for k in close:
+        for k, score in scored:
             r = self._norm_real_index[k]
             f = self.real_to_fake.get(r)
-            score = difflib.SequenceMatcher(None, q, k).ratio()
             suggestions.append((r, f, score))
 
         if suggestions:
@@ -83,15 +147,71 @@ class NameMapper:
 
         return NameMatch(real=None, fake=None, confidence=0.0, suggestions=[])
 
+    def _candidates(self, q: str, top_k: int = 32) -> List[str]:
+        if len(self._norm_keys) <= top_k:
+            return list(self._norm_keys)
+
+        q_grams = _skip_bigrams(q)
+        hits: Counter = Counter()
+        for g in q_grams:
+            hits.update(self._bigram_index.get(g, ()))
+        if not hits:
+            return []
+
+        nq = len(q_grams)
+        counts = self._key_bigram_count
+        best = heapq.nlargest(
+            top_k,
+            hits.items(),
+            key=lambda kv: kv[1] / (nq + counts[kv[0]] - kv[1]),
+        )
+        return [self._norm_keys[idx] for idx, _ in best]
+
     def replace_in_text(self, text: str) -> str:
         if not text:
             return text
+        if self._automaton is not None:
+            return self._replace_with_automaton(text)
+        if self._replace_pattern is None:
+            return text
+
+        lookup = self.real_to_fake.get
 
         def _repl(m: re.Match) -> str:
-            real = m.group(1)
-            return self.real_to_fake.get(real, real)
+            real = m.group(0)
+            return lookup(real, real)
 
         return self._replace_pattern.sub(_repl, text)
 
+    def _replace_with_automaton(self, text: str) -> str:
+        # gleiche Semantik wie die Regex: Wortgrenzen, links zuerst, pro Start der längste Treffer
+        n = len(text)
+        best: Dict[int, Tuple[int, str]] = {}  # start -> (end, fake)
+        for end_idx, (length, fake) in self._automaton.iter(text):
+            start = end_idx - length + 1
+            end = end_idx + 1
+            if start > 0 and _RE_WORD_CHAR.match(text[start - 1]):
+                continue
+            if end < n and _RE_WORD_CHAR.match(text[end]):
+                continue
+            prev = best.get(start)
+            if prev is None or prev[0] < end:
+                best[start] = (end, fake)
+
+        if not best:
+            return text
+
+        out: List[str] = []
+        pos = 0
+        for start in sorted(best):
+            if start < pos:
+                continue
+            end, fake = best[start]
+            out.append(text[pos:start])
+            out.append(fake)
+            pos = end
+        out.append(text[pos:])
+        return "".join(out)
+
     def size(self) -> int:
         return len(self.real_to_fake)
@@ -1,34 +1,41 @@
 # tools/puls_renderer/__init__.py
+#
+# Lazy Re-Exports (PEP 562): die Renderer-Module ziehen PIL/numpy + Fonts nach.
+# Erst beim ersten Zugriff auf ein Symbol wird das jeweilige Submodul importiert,
+# damit Pages, die nur die JSON-Helper brauchen, nicht den ganzen Renderer laden.
+from importlib import import_module
+
+_EXPORTS = {
+    # Public API: Matchday
+    "render_from_json_file": ".renderer",
+    "render_matchday_overview": ".renderer",
+
+    # Public API: Starting 6
+    "render_starting6_from_files": ".starting6_renderer",
+
+    # Public API: League table
+    "render_table_from_matchday_json": ".league_table_renderer",          # preferred public name
+    "render_league_table_from_matchday_json": ".league_table_renderer",   # keep for backwards compatibility / internal use
+
+    # Layout / helpers you actually reuse from pages/tools
+    "MatchdayLayoutV1": ".layout_config",
+    "extract_starting6_for_matchup": ".lineup_adapter",
+    "list_matchups_from_matchday_json": ".tools_starting6",
+}
+
+
+def __getattr__(name):
+    mod = _EXPORTS.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(mod, __name__), name)
+    globals()[name] = value  # nächster Zugriff ohne __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
 
-# Public API: Matchday
-from .renderer import (
-    render_from_json_file,
-    render_matchday_overview,
-)
-
-# Public API: Starting 6
-from .starting6_renderer import (
-    render_starting6_from_files,
-)
-
-# Public API: League table
-from .league_table_renderer import (
-    render_table_from_matchday_json,          # preferred public name
-    render_league_table_from_matchday_json,   # keep for backwards compatibility / internal use
-)
-
-# Layout / helpers you actually reuse from pages/tools
-from .layout_config import (
-    MatchdayLayoutV1,
-)
-
-from .lineup_adapter import (
-    extract_starting6_for_matchup,
-)
-
-from .tools_starting6 import (
-    list_matchups_from_matchday_json,
-)
 
 __all__ = [
     # Matchday
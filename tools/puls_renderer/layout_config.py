@@ -1,6 +1,7 @@
 from dataclasses import dataclass
-from typing import List, Tuple
-from dataclasses import dataclass
+from typing import Tuple
+
+__all__ = ["MatchdayLayoutV1", "Starting6LayoutV1"]
 
 
 @dataclass(frozen=True)
@@ -15,8 +16,8 @@ class MatchdayLayoutV1:
 
     # --- Match rows: Y-Positionen ---
     # Leicht hochgezogen im Süd-Block (unten war's bei dir am knappsten)
-    y_nord: List[int] = (430, 510, 590, 670, 750)
-    y_sued: List[int] = (875, 955, 1035, 1110, 1185)
+    y_nord: Tuple[int, ...] = (430, 510, 590, 670, 750)
+    y_sued: Tuple[int, ...] = (875, 955, 1035, 1110, 1185)
 
     # --- Symmetrie / Slots ---
     center_x: int = 540
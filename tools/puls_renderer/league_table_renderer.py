@@ -3,8 +3,9 @@ from __future__ import annotations
 import json
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from .layout_config import Starting6LayoutV1
 
 
@@ -14,13 +15,28 @@ from PIL import Image, ImageDraw, ImageFont
 from .renderer import (
     RenderPaths,
     _safe_load_json,
-    _fit_text,
-    _load_font,
-    _load_logo,
+    _fit_text_cached,
+    _load_font_cached,
+    _load_logo_cached,
+    _logo_mtime,
     _draw_watermark,
     draw_text_fx,
+    _render_text_fx_cached,
+    _load_display_map_cached,
+    _load_template_rgba,
 )
 
+# Pfade sind zur Importzeit bekannt -> einmal auflösen statt bei jedem Render
+_BASE_DIR = Path(__file__).resolve().parent
+_PATHS = RenderPaths(base_dir=_BASE_DIR)
+_TEMPLATES_DIR = _PATHS.templates_dir
+_LOGOS_DIR = _PATHS.logos_dir
+_FONTS_DIR = _PATHS.fonts_dir
+_OUTPUT_DIR = _PATHS.output_dir
+_FONT_BOLD_PATH = _FONTS_DIR / "Inter-Bold.ttf"
+_FONT_MED_PATH = _FONTS_DIR / "Inter-Medium.ttf"
+_DISPLAY_MAP_PATH = _BASE_DIR / "assets" / "team_display_names.json"
+
 # ----------------------------
 # Layout
 # ----------------------------
@@ -54,11 +70,17 @@ class LeagueTableLayoutV1:
     color_grid: Tuple[int, int, int, int] = (130, 220, 255, 80)
 
 
+_RE_DELTA = re.compile(r"^(delta|Δ)\s*", re.IGNORECASE)
+_RE_WS = re.compile(r"[\s_]+")
+_RE_NONSLUG = re.compile(r"[^a-z0-9\-]+")
+_RE_DASHES = re.compile(r"-{2,}")
+
+
 def _normalize_delta_date(delta_date: Optional[str]) -> str:
     if not delta_date:
         return ""
     s = str(delta_date).strip()
-    s = re.sub(r"^(delta|Δ)\s*", "", s, flags=re.IGNORECASE).strip()
+    s = _RE_DELTA.sub("", s).strip()
     if not s:
         return ""
     if not s.startswith("Δ"):
@@ -86,6 +108,7 @@ def _try_extract_season_spieltag(meta: Dict[str, Any]) -> Tuple[Optional[int], O
     return _to_int(season), _to_int(spieltag)
 
 
+@lru_cache(maxsize=512)
 def _slugify_fallback(team_name: str) -> str:
     s = (team_name or "").strip().lower()
     s = (
@@ -94,17 +117,151 @@ def _slugify_fallback(team_name: str) -> str:
          .replace("ü", "ue")
          .replace("ß", "ss")
     )
-    s = re.sub(r"[\s_]+", "-", s)
-    s = re.sub(r"[^a-z0-9\-]+", "", s).strip("-")
-    s = re.sub(r"-{2,}", "-", s)
+    s = _RE_WS.sub("-", s)
+    s = _RE_NONSLUG.sub("", s).strip("-")
+    s = _RE_DASHES.sub("-", s)
     return s
 
 
-def _resolve_team_slug(team_name: str, display_map: Dict[str, str]) -> str:
-    # display_map: slug -> DisplayName
-    reverse = {v.strip().lower(): k for k, v in display_map.items()}
+def _fmt_gd(gd: Any) -> str:
+    # GD with sign
+    try:
+        return f"{int(gd):+d}"
+    except Exception:
+        return str(gd)
+
+
+def _prepare_row(rank: int, r: Dict[str, Any], reverse_display: Dict[str, str]) -> Tuple[str, ...]:
+    # (rank, team, slug, pts, gf, ga, gd) als fertige Strings
+    team_name = str(r.get("Team", ""))
+    return (
+        f"{rank}.",
+        team_name,
+        _resolve_team_slug_fast(team_name, reverse_display),
+        str(r.get("Points", 0)),
+        str(r.get("GF", 0)),
+        str(r.get("GA", 0)),
+        _fmt_gd(r.get("GD", 0)),
+    )
+
+
+def _reverse_display_map(display_map: Dict[str, str]) -> Dict[str, str]:
+    # display_map: slug -> DisplayName  =>  displayname (lower) -> slug
+    return {v.strip().lower(): k for k, v in display_map.items()}
+
+
+def _resolve_team_slug_fast(team_name: str, reverse_display: Dict[str, str]) -> str:
     key = (team_name or "").strip().lower()
-    return reverse.get(key) or _slugify_fallback(team_name)
+    return reverse_display.get(key) or _slugify_fallback(team_name)
+
+
+def _resolve_team_slug(team_name: str, display_map: Dict[str, str]) -> str:
+    return _resolve_team_slug_fast(team_name, _reverse_display_map(display_map))
+
+
+# ----------------------------
+# Column layout (zentriert!)
+# ----------------------------
+# Ziel: Team-Spalte schmaler, rechts alles sichtbar.
+COL_RANK = 56
+COL_LOGO = 52
+COL_TEAM = 380   # <= hier bewusst schmaler als vorher, aber lang genug für Schwenningen Sturmflügel
+COL_PTS  = 80
+COL_GF   = 70
+COL_GA   = 70
+COL_GD   = 70
+
+
+class _ColGeom(NamedTuple):
+    x_rank: int
+    x_logo: int
+    x_team: int
+    x_pts: int
+    x_gf: int
+    x_ga: int
+    x_gd: int
+    # Spaltenmitten der Zahlen
+    cx_pts: int
+    cx_gf: int
+    cx_ga: int
+    cx_gd: int
+    # pro Zeile: Oberkante + Mitte
+    y_tops: Tuple[int, ...]
+    y_mids: Tuple[int, ...]
+
+
+@lru_cache(maxsize=16)
+def _column_geom(width: int, table_top: int, header_row_h: int, row_h: int, nrows: int) -> _ColGeom:
+    # Spalten-/Zeilenpositionen hängen nur vom Layout ab -> einmal pro Block-Geometrie rechnen
+    table_width = COL_RANK + COL_LOGO + COL_TEAM + COL_PTS + COL_GF + COL_GA + COL_GD
+    x0 = (width - table_width) // 2  # DAS ist die echte Zentrierung
+
+    x_rank = x0
+    x_logo = x_rank + COL_RANK
+    x_team = x_logo + COL_LOGO
+    x_pts  = x_team + COL_TEAM
+    x_gf   = x_pts + COL_PTS
+    x_ga   = x_gf + COL_GF
+    x_gd   = x_ga + COL_GA
+
+    y_tops = tuple(table_top + header_row_h + i * row_h for i in range(nrows))
+    y_mids = tuple(y + row_h // 2 for y in y_tops)
+
+    return _ColGeom(
+        x_rank, x_logo, x_team, x_pts, x_gf, x_ga, x_gd,
+        x_pts + COL_PTS // 2, x_gf + COL_GF // 2, x_ga + COL_GA // 2, x_gd + COL_GD // 2,
+        y_tops, y_mids,
+    )
+
+
+@lru_cache(maxsize=16)
+def _block_chrome_masks(
+    font_path_str: str,
+    font_size: int,
+    width: int,
+    height: int,
+    labels: Tuple[Tuple[int, int, str, str], ...],
+    lines: Tuple[Tuple[int, int, int, int], ...],
+) -> Tuple[Tuple[Image.Image, Tuple[int, int]], Tuple[Image.Image, Tuple[int, int]]]:
+    # Kopfzeile + Trennlinien eines Blocks als L-Masken (Koordinaten relativ zu table_top).
+    # paste(farbe, maske) mischt exakt wie draw.text/draw.line direkt aufs Bild.
+    font = _load_font_cached(font_path_str, font_size)
+
+    label_mask = Image.new("L", (width, height), 0)
+    ld = ImageDraw.Draw(label_mask)
+    for x, y, text, anchor in labels:
+        ld.text((x, y), text, font=font, fill=255, anchor=anchor)
+
+    line_mask = Image.new("L", (width, height), 0)
+    gd = ImageDraw.Draw(line_mask)
+    for xy in lines:
+        gd.line(xy, fill=255, width=2)
+
+    # auf den tatsächlich bemalten Bereich zuschneiden -> paste fasst nur diese Pixel an
+    return _crop_to_content(label_mask), _crop_to_content(line_mask)
+
+
+def _crop_to_content(mask: Image.Image) -> Tuple[Image.Image, Tuple[int, int]]:
+    bbox = mask.getbbox()
+    if bbox is None:
+        return mask.crop((0, 0, 1, 1)), (0, 0)
+    return mask.crop(bbox), (bbox[0], bbox[1])
+
+
+@lru_cache(maxsize=512)
+def _text_mask_cached(
+    font_path_str: str,
+    font_size: int,
+    text: str,
+    anchor: str,
+) -> Tuple[Image.Image, Tuple[int, int]]:
+    # Zahlen/Ränge wiederholen sich ständig ("0".."99", "+3", ...): Maske einmal rendern,
+    # danach nur noch paste(farbe, maske) – gleiches Ergebnis wie draw.text an derselben Stelle.
+    font = _load_font_cached(font_path_str, font_size)
+    x0, y0, x1, y1 = font.getbbox(text, anchor=anchor)
+    mask = Image.new("L", (max(1, x1 - x0), max(1, y1 - y0)), 0)
+    ImageDraw.Draw(mask).text((-x0, -y0), text, font=font, fill=255, anchor=anchor)
+    return mask, (x0, y0)
 
 
 def _draw_table_block(
@@ -123,117 +280,79 @@ def _draw_table_block(
     font_med_path = fonts_dir / "Inter-Medium.ttf"
 
     # Titel (du willst den ggf. später selbst reinmalen – kannst du auch einfach auskommentieren)
-    font_block_title = _load_font(font_bold_path, 34)
-    draw_text_fx(
-        img,
-        (layout.width // 2, title_y),
+    # Shadow + Stroke als enge Kachel statt Vollbild-Layer
+    tile, (ox, oy) = _render_text_fx_cached(
         title.upper(),
-        font_block_title,
-        fill=layout.color_text,
+        str(font_bold_path),
+        34,
+        layout.color_text,
         anchor="mm",
-        glow=False,
-        shadow=True,
         shadow_offset=(0, 2),
         shadow_alpha=140,
-        stroke=True,
         stroke_width=2,
         stroke_fill=(0, 0, 0, 170),
     )
-
-    # ----------------------------
-    # Column layout (zentriert!)
-    # ----------------------------
-    # Ziel: Team-Spalte schmaler, rechts alles sichtbar.
-    col_rank = 56
-    col_logo = 52
-    col_team = 380   # <= hier bewusst schmaler als vorher, aber lang genug für Schwenningen Sturmflügel
-    col_pts  = 80
-    col_gf   = 70
-    col_ga   = 70
-    col_gd   = 70
-
-    table_width = col_rank + col_logo + col_team + col_pts + col_gf + col_ga + col_gd
-    x0 = (layout.width - table_width) // 2  # DAS ist die echte Zentrierung
-
-    x_rank = x0
-    x_logo = x_rank + col_rank
-    x_team = x_logo + col_logo
-    x_pts  = x_team + col_team
-    x_gf   = x_pts + col_pts
-    x_ga   = x_gf + col_gf
-    x_gd   = x_ga + col_ga
-
-    # header labels (ohne Backplate!)
-    font_hdr = _load_font(font_bold_path, 22)
-    y_hdr = table_top + layout.header_row_h // 2
-
-    draw.text((x_rank + 10, y_hdr), "#", font=font_hdr, fill=layout.color_text, anchor="lm")
-    draw.text((x_team + 10, y_hdr), "TEAM", font=font_hdr, fill=layout.color_text, anchor="lm")
-    draw.text((x_pts + col_pts // 2, y_hdr), "PTS", font=font_hdr, fill=layout.color_text, anchor="mm")
-    draw.text((x_gf + col_gf // 2, y_hdr), "GF", font=font_hdr, fill=layout.color_text, anchor="mm")
-    draw.text((x_ga + col_ga // 2, y_hdr), "GA", font=font_hdr, fill=layout.color_text, anchor="mm")
-    draw.text((x_gd + col_gd // 2, y_hdr), "GD", font=font_hdr, fill=layout.color_text, anchor="mm")
-
-    # verticale separator (optional, subtil)
+    img.alpha_composite(tile, (layout.width // 2 + ox, title_y + oy))
+
+    g = _column_geom(layout.width, table_top, layout.header_row_h, layout.row_h, len(rows))
+
+    # header labels (ohne Backplate!) + verticale separator (optional, subtil)
+    # -> statisch pro Layout, daher als gecachte Masken; pro Render nur 2x paste
+    y_hdr = layout.header_row_h // 2
+    labels = (
+        (g.x_rank + 10, y_hdr, "#", "lm"),
+        (g.x_team + 10, y_hdr, "TEAM", "lm"),
+        (g.cx_pts, y_hdr, "PTS", "mm"),
+        (g.cx_gf, y_hdr, "GF", "mm"),
+        (g.cx_ga, y_hdr, "GA", "mm"),
+        (g.cx_gd, y_hdr, "GD", "mm"),
+    )
     panel_h = layout.header_row_h + len(rows) * layout.row_h
-    for x in [x_pts, x_gf, x_ga, x_gd]:
-        draw.line((x, table_top + 10, x, table_top + panel_h - 10), fill=layout.color_grid, width=2)
+    lines = tuple((x, 10, x, panel_h - 10) for x in (g.x_pts, g.x_gf, g.x_ga, g.x_gd))
 
-    # rows (keine Hintergründe!)
-    font_team = _load_font(font_bold_path, 24)
-    font_num  = _load_font(font_med_path, 24)
+    (label_mask, (lx, ly)), (line_mask, (gx, gy)) = _block_chrome_masks(
+        str(font_bold_path), 22, layout.width, panel_h, labels, lines
+    )
+    img.paste(layout.color_text, (lx, table_top + ly), label_mask)
+    img.paste(layout.color_grid, (gx, table_top + gy), line_mask)
 
-    for i, r in enumerate(rows):
-        y = table_top + layout.header_row_h + i * layout.row_h
-        y_mid = y + layout.row_h // 2
+    # rows (keine Hintergründe!)
+    font_num_path = str(font_med_path)
+    logos_dir_str = str(logos_dir)
 
-        rank = i + 1
-        team_name = str(r.get("Team", ""))
-        pts = r.get("Points", 0)
-        gf = r.get("GF", 0)
-        ga = r.get("GA", 0)
-        gd = r.get("GD", 0)
+    logo_dy = (layout.row_h - 34) // 2
+    reverse_display = _reverse_display_map(display_map)  # einmal pro Block statt pro Zeile
 
-        team_slug = _resolve_team_slug(team_name, display_map)
+    # Zeilen einmal vorab in fertige Strings übersetzen; die Schleife unten zeichnet nur noch
+    prepared = [_prepare_row(i + 1, r, reverse_display) for i, r in enumerate(rows)]
 
+    for y, y_mid, (rank_str, team_name, team_slug, pts_str, gf_str, ga_str, gd_str) in zip(g.y_tops, g.y_mids, prepared):
         # logo
-        logo = _load_logo(logos_dir, team_slug, size=34, accent=layout.color_accent)
-        img.alpha_composite(logo, (x_logo + 6, y + (layout.row_h - 34) // 2))
+        logo = _load_logo_cached(logos_dir_str, team_slug, 34, layout.color_accent, _logo_mtime(logos_dir_str, team_slug))
+        img.alpha_composite(logo, (g.x_logo + 6, y + logo_dy))
 
         # rank
-        draw.text((x_rank + 12, y_mid), f"{rank}.", font=font_num, fill=layout.color_text, anchor="lm")
+        mask, (ox, oy) = _text_mask_cached(font_num_path, 24, rank_str, "lm")
+        img.paste(layout.color_text, (g.x_rank + 12 + ox, y_mid + oy), mask)
 
-        # team text
-        draw_text_fx(
-            img,
-            (x_team + 10, y_mid),
+        # team text (Shadow + Stroke als gecachte Kachel; Teamnamen wiederholen sich über Spieltage)
+        tile, (ox, oy) = _render_text_fx_cached(
             team_name,
-            font_team,
-            fill=layout.color_text,
+            str(font_bold_path),
+            24,
+            layout.color_text,
             anchor="lm",
-            glow=False,
-            shadow=True,
             shadow_offset=(0, 2),
             shadow_alpha=120,
-            stroke=True,
             stroke_width=2,
             stroke_fill=(0, 0, 0, 160),
         )
+        img.alpha_composite(tile, (g.x_team + 10 + ox, y_mid + oy))
 
-        def num_center(val: Any, xx: int, ww: int):
-            draw.text((xx + ww // 2, y_mid), str(val), font=font_num, fill=layout.color_text, anchor="mm")
-
-        num_center(pts, x_pts, col_pts)
-        num_center(gf,  x_gf,  col_gf)
-        num_center(ga,  x_ga,  col_ga)
-
-        # GD with sign
-        try:
-            gd_i = int(gd)
-            gd_str = f"{gd_i:+d}"
-        except Exception:
-            gd_str = str(gd)
-        num_center(gd_str, x_gd, col_gd)
+        # Zahlen zentriert, GD mit Vorzeichen
+        for val, cx in ((pts_str, g.cx_pts), (gf_str, g.cx_gf), (ga_str, g.cx_ga), (gd_str, g.cx_gd)):
+            mask, (ox, oy) = _text_mask_cached(font_num_path, 24, val, "mm")
+            img.paste(layout.color_text, (cx + ox, y_mid + oy), mask)
 
 
 def render_league_table_from_matchday_json(
@@ -241,16 +360,16 @@ def render_league_table_from_matchday_json(
     template_name: str = "league_table_v1.png",  # <- dein Asset
     out_name: Optional[str] = None,
     delta_date: Optional[str] = None,
+    compress_level: int = 1,
 ) -> Path:
     """
     Rendert NORD + SÜD in EINEM Bild (1080x1350).
+    compress_level: 1 = schnell (Preview/Default), 6+ für kleinere finale Dateien.
     Erwartet in matchday json:
       - tabelle_nord: [{Team, Points, GF, GA, GD}, ...] (10 Teams)
       - tabelle_sued: [{...}] (10 Teams)
       - optional: season/saison + spieltag
     """
-    base_dir = Path(__file__).resolve().parent
-    paths = RenderPaths(base_dir=base_dir)
     layout = LeagueTableLayoutV1()
 
     data = _safe_load_json(Path(matchday_json_path))
@@ -278,7 +397,7 @@ def render_league_table_from_matchday_json(
     if len(nord_rows) != 10 or len(sued_rows) != 10:
         raise ValueError(f"Erwarte 10 Teams pro Division. Got nord={len(nord_rows)} sued={len(sued_rows)}")
 
-    template_path = paths.templates_dir / template_name
+    template_path = _TEMPLATES_DIR / template_name
     if not template_path.exists():
         raise FileNotFoundError(f"Template not found: {template_path}")
 
@@ -286,18 +405,18 @@ def render_league_table_from_matchday_json(
         st_val = spieltag if spieltag is not None else "X"
         out_name = f"tabelle_spieltag_{int(st_val):02d}.png" if str(st_val).isdigit() else f"tabelle_spieltag_{st_val}.png"
 
-    out_path = paths.output_dir / out_name
+    out_path = _OUTPUT_DIR / out_name
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    img = Image.open(template_path).convert("RGBA")
+    img = _load_template_rgba(str(template_path), template_path.stat().st_mtime_ns).copy()
     draw = ImageDraw.Draw(img)
 
     # Fonts
-    font_bold_path = paths.fonts_dir / "Inter-Bold.ttf"
-    font_med_path = paths.fonts_dir / "Inter-Medium.ttf"
+    font_bold_path = str(_FONT_BOLD_PATH)
+    font_med_path = str(_FONT_MED_PATH)
 
     # Header brand
-    font_brand = _load_font(font_bold_path, 34)
+    font_brand = _load_font_cached(font_bold_path, 34)
     draw_text_fx(
         img,
         (layout.width // 2, layout.header_brand_y),
@@ -317,36 +436,33 @@ def render_league_table_from_matchday_json(
     )
 
     # Header title
-    font_title = _fit_text(draw, "LIGA-TABELLE", font_bold_path, max_width=920, start_size=64, min_size=44)
-    draw_text_fx(
-        img,
-        (layout.width // 2, layout.header_title_y),
+    font_title = _fit_text_cached("LIGA-TABELLE", font_bold_path, 920, 64, 44)
+    tile, (ox, oy) = _render_text_fx_cached(
         "",
-        font_title,
-        fill=layout.color_text,
+        font_bold_path,
+        font_title.size,
+        layout.color_text,
         anchor="mm",
-        glow=False,
-        shadow=True,
         shadow_offset=(0, 4),
         shadow_alpha=150,
-        stroke=True,
         stroke_width=2,
         stroke_fill=(0, 0, 0, 170),
     )
+    img.alpha_composite(tile, (layout.width // 2 + ox, layout.header_title_y + oy))
 
     # Sub
-    font_sub = _fit_text(draw, sub, font_med_path, max_width=920, start_size=26, min_size=18)
+    font_sub = _fit_text_cached(sub, font_med_path, 920, 26, 18)
     draw.text((layout.width // 2, layout.header_sub_y), sub, font=font_sub, fill=layout.color_accent, anchor="mm")
 
     # Δ date sichtbar
-    font_date = _load_font(font_med_path, 20)
+    font_date = _load_font_cached(font_med_path, 20)
     draw.text((layout.width // 2, layout.header_date_y), date_str, font=font_date, fill=layout.color_accent, anchor="mm")
 
     # display map (optional)
-    display_map_path = paths.fonts_dir.parent / "team_display_names.json"
+    display_map_path = _DISPLAY_MAP_PATH
     display_map: Dict[str, str] = {}
     if display_map_path.exists():
-        display_map = json.loads(display_map_path.read_text(encoding="utf-8"))
+        display_map = _load_display_map_cached(str(display_map_path), display_map_path.stat().st_mtime_ns)
 
     # Blocks
     _draw_table_block(
@@ -357,8 +473,8 @@ def render_league_table_from_matchday_json(
         title_y=layout.nord_title_y,
         table_top=layout.nord_table_top,
         rows=nord_rows,
-        logos_dir=paths.logos_dir,
-        fonts_dir=paths.fonts_dir,
+        logos_dir=_LOGOS_DIR,
+        fonts_dir=_FONTS_DIR,
         display_map=display_map,
     )
 
@@ -370,13 +486,13 @@ def render_league_table_from_matchday_json(
         title_y=layout.sued_title_y,
         table_top=layout.sued_table_top,
         rows=sued_rows,
-        logos_dir=paths.logos_dir,
-        fonts_dir=paths.fonts_dir,
+        logos_dir=_LOGOS_DIR,
+        fonts_dir=_FONTS_DIR,
         display_map=display_map,
     )
 
     # watermark
-    wm_font = ImageFont.truetype(str(paths.fonts_dir / "Inter-Medium.ttf"), size=20)
+    wm_font = _load_font_cached(font_med_path, 20)
     _draw_watermark(
         img,
         draw,
@@ -386,7 +502,7 @@ def render_league_table_from_matchday_json(
         opacity=90,
     )
 
-    img.save(out_path)
+    img.save(out_path, format="PNG", compress_level=compress_level)
     return out_path
 
 
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
 import json
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+
+try:
+    import orjson  # schneller C-Parser, optional
+except ImportError:
+    orjson = None
 
 
 JsonLike = Union[Dict[str, Any], Path, str]
@@ -13,7 +20,10 @@ def _load_json(x: JsonLike) -> Dict[str, Any]:
     if isinstance(x, dict):
         return x
     p = Path(x)  # works for Path and str
-    return json.loads(p.read_text(encoding="utf-8"))
+    raw = p.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
 
 
 def list_matchups_from_matchday_json(matchday: JsonLike) -> List[Dict[str, str]]:
@@ -25,27 +35,24 @@ def list_matchups_from_matchday_json(matchday: JsonLike) -> List[Dict[str, str]]
     """
     data = _load_json(matchday)
 
-    out: List[Dict[str, str]] = []
-
     # generator style
     results = data.get("results")
     if isinstance(results, list):
-        for r in results:
-            home = (r or {}).get("home")
-            away = (r or {}).get("away")
-            if home and away:
-                out.append({"home": str(home), "away": str(away)})
-        return out
+        return _pairs(results)
 
     # matchday overview style
-    nord = data.get("nord", [])
-    sued = data.get("sued", [])
-    for r in (nord + sued):
-        home = (r or {}).get("home")
-        away = (r or {}).get("away")
+    return _pairs(chain(data.get("nord", []), data.get("sued", [])))
+
+
+def _pairs(rows: Iterable[Any]) -> List[Dict[str, str]]:
+    out: List[Dict[str, str]] = []
+    for r in rows:
+        if not r:
+            continue
+        home = r.get("home")
+        away = r.get("away")
         if home and away:
             out.append({"home": str(home), "away": str(away)})
-
     return out
 
 
@@ -56,23 +63,20 @@ def extract_starting6_for_team(lineups_json: dict, team_name: str) -> dict:
 
     t = teams[team_name]
 
-    forwards = (((t.get("forwards") or {}).get("line1")) or [])
-    defense = (((t.get("defense") or {}).get("pair1")) or [])
-    goalie = t.get("goalie") or {}
-
-    # robust: Typen absichern
-    if not isinstance(forwards, list):
-        forwards = []
-    if not isinstance(defense, list):
-        defense = []
-    if not isinstance(goalie, dict):
-        goalie = {}
-
+    # robust: Typen je Ebene genau einmal absichern
     # NICHT stringifyen – wir behalten dicts!
-    forwards = forwards[:3]
-    defense = defense[:2]
+    goalie = t.get("goalie")
+    return {
+        "forwards": _nested_list(t, "forwards", "line1")[:3],
+        "defense": _nested_list(t, "defense", "pair1")[:2],
+        "goalie": goalie if isinstance(goalie, dict) else {},
+    }
+
 
-    return {"forwards": forwards, "defense": defense, "goalie": goalie}
+def _nested_list(t: Dict[str, Any], key: str, sub: str) -> list:
+    node = t.get(key)
+    val = node.get(sub) if isinstance(node, dict) else None
+    return val if isinstance(val, list) else []
 
 
 
@@ -84,8 +88,9 @@ def extract_starting6_for_matchup(
     """
     Returns both teams starting6 in one object.
     """
-    home = extract_starting6_for_team(lineups_json, home_name)
-    away = extract_starting6_for_team(lineups_json, away_name)
+    data = _load_json(lineups_json)  # einmal laden, beide Teams daraus lesen
+    home = extract_starting6_for_team(data, home_name)
+    away = extract_starting6_for_team(data, away_name)
 
     return {
         "home": {"team": home_name, **home},
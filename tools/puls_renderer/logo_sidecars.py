@@ -0,0 +1,61 @@
+# tools/puls_renderer/logo_sidecars.py
+#
+# Vorskalierte Logos (<team>@<size>.png neben dem Original) für alle PULS-Renderer.
+# Werden beim Deploy erzeugt und sind per .gitignore aus dem Repo ausgenommen.
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+from PIL import Image
+
+from .layout_config import MatchdayLayoutV1, Starting6LayoutV1
+
+
+def sidecar_path(src: Path, size: int) -> Path:
+    return src.with_name(f"{src.stem}@{size}.png")
+
+
+def load_logo_sidecar(src: Path, size: int) -> Optional[Image.Image]:
+    # nur nehmen, wenn nicht älter als das Original-Logo (sonst veraltet)
+    side = sidecar_path(src, size)
+    try:
+        if side.stat().st_mtime_ns < src.stat().st_mtime_ns:
+            return None
+        with Image.open(side) as im:
+            im = im.convert("RGBA")
+    except (OSError, ValueError):
+        return None
+    return im if im.size == (size, size) else None
+
+
+def prebuild_logo_sidecars(logos_dir: Path, sizes: Optional[Iterable[int]] = None) -> int:
+    """
+    Schreibt <team>@<size>.png neben jedes Logo (gleicher LANCZOS-Resize wie zur Laufzeit,
+    PNG ist verlustfrei -> pixelgleich). Für den Deploy gedacht; gibt Anzahl geschriebener Dateien zurück.
+    """
+    if sizes is None:
+        # Matchday/Results, Starting 6, Tabelle (34px fest in league_table_renderer)
+        sizes = (MatchdayLayoutV1().logo_size, Starting6LayoutV1().logo_size, 34)
+    sizes = sorted(set(sizes))
+
+    written = 0
+    for src in sorted(Path(logos_dir).glob("*.png")):
+        if "@" in src.stem:
+            continue
+        todo = [
+            s for s in sizes
+            if not sidecar_path(src, s).exists()
+            or sidecar_path(src, s).stat().st_mtime_ns < src.stat().st_mtime_ns
+        ]
+        if not todo:
+            continue
+        with Image.open(src) as im:
+            full = im.convert("RGBA")
+        for s in todo:
+            full.resize((s, s), Image.LANCZOS).save(sidecar_path(src, s), format="PNG")
+            written += 1
+    return written
+
+
+__all__ = ["sidecar_path", "load_logo_sidecar", "prebuild_logo_sidecars"]
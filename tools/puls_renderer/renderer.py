@@ -1,15 +1,35 @@
 import json
+import math
+import os
 import random
 import re
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
 
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageChops
 
-from .layout_config import MatchdayLayoutV1
+try:
+    import orjson  # schneller C-Parser, optional
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # vektorisierte Noise-Masken, optional
+except ImportError:
+    np = None
+
+from .layout_config import MatchdayLayoutV1, Starting6LayoutV1
 from .adapter import convert_generator_json_to_matchday
+from .logo_sidecars import load_logo_sidecar
+
+# Slug-Helfer: einmal kompilieren statt pro Aufruf
+_UMLAUT_TABLE = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+_RE_SLUG_WS = re.compile(r"[\s_]+")
+_RE_SLUG_NONALNUM = re.compile(r"[^a-z0-9\-]+")
+_RE_SLUG_DASHES = re.compile(r"-{2,}")
 
 
 # ----------------------------
@@ -43,26 +63,66 @@ def _load_team_meta(assets_dir: Path) -> dict:
     p = assets_dir / "team_meta.json"
     if not p.exists():
         return {}
+    return _load_team_meta_cached(str(p), p.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_team_meta_cached(path_str: str, mtime_ns: int) -> dict:
+    # pro (Datei, mtime) einmal parsen; Dict wird geteilt -> nur lesen
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        return json.loads(Path(path_str).read_text(encoding="utf-8"))
     except Exception:
         return {}
 
 
 
+def _loads_bytes(raw: bytes) -> Any:
+    # Bytes direkt parsen (kein Umweg über str), Fallback stdlib
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
 def _safe_load_json(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return _loads_bytes(path.read_bytes())
 
 
 def _load_font(font_path: Path, size: int) -> ImageFont.FreeTypeFont:
-    if not font_path.exists():
-        raise FileNotFoundError(f"Font not found: {font_path}")
-    return ImageFont.truetype(str(font_path), size)
+    # alle Aufrufer (fit-Schleifen, Zeilen, Header, Watermark) teilen sich den Cache
+    return _load_font_cached(str(font_path), size)
+
+
+@lru_cache(maxsize=256)
+def _load_font_cached(path_str: str, size: int) -> ImageFont.FreeTypeFont:
+    # TTF einmal pro (Datei, Größe) parsen; FreeTypeFont wird nur gelesen, nie verändert
+    if not Path(path_str).exists():
+        raise FileNotFoundError(f"Font not found: {path_str}")
+    return ImageFont.truetype(path_str, size)
+
+@lru_cache(maxsize=4)
+def _load_template_rgba(path_str: str, mtime_ns: int) -> Image.Image:
+    # dekodiertes Template pro (Datei, mtime); Aufrufer arbeiten immer auf einer .copy()
+    with Image.open(path_str) as im:
+        return im.convert("RGBA")
+
 
 def _text_width_singleline(draw, s: str, font) -> int:
     # textlength crasht bei multiline -> hier nur singleline messen
-    return int(draw.textlength(s, font=font))
+    return int(_text_length_cached(font, s, draw.fontmode))
+
+
+@lru_cache(maxsize=4096)
+def _text_length_cached(font: ImageFont.FreeTypeFont, text: str, mode: str) -> float:
+    # Key ist das Font-Objekt selbst (kommt aus _load_font_cached, also stabil);
+    # gleiche Messung wie draw.textlength
+    return font.getlength(text, mode)
+
+
+@lru_cache(maxsize=4096)
+def _text_bbox_w_cached(font: ImageFont.FreeTypeFont, text: str, mode: str) -> int:
+    # gleiche Messung wie draw.textbbox((0, 0), ...) – Teamnamen/Präfixe wiederholen sich ständig
+    bbox = font.getbbox(text, mode)
+    return int(bbox[2] - bbox[0])
 
 
 def _fit_text(
@@ -73,23 +133,56 @@ def _fit_text(
     start_size: int,
     min_size: int = 18,
 ) -> ImageFont.FreeTypeFont:
-    size = start_size
-    while size >= min_size:
+    # multiline-safe: max width der einzelnen Zeilen messen
+    lines = str(text).split("\n")
+
+    def _fits(size: int) -> bool:
         font = _load_font(font_path, size)
-                # multiline-safe: max width der einzelnen Zeilen messen
-        lines = str(text).split("\n")
-        w = max((_text_width_singleline(draw, line, font) for line in lines), default=0)
+        return max((_text_width_singleline(draw, line, font) for line in lines), default=0) <= max_width
+
+    # Binärsuche auf dem bisherigen 2er-Raster start_size, start_size-2, ... (>= min_size):
+    # kleinstes k, bei dem start_size - 2k passt (Breite wächst monoton mit der Größe)
+    lo, hi = 0, (start_size - min_size) // 2 + 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _fits(start_size - 2 * mid):
+            hi = mid
+        else:
+            lo = mid + 1
+    if lo <= (start_size - min_size) // 2:
+        return _load_font(font_path, start_size - 2 * lo)
+    return _load_font(font_path, min_size)
 
+@lru_cache(maxsize=64)
+def _fit_text_cached(
+    text: str,
+    font_path_str: str,
+    max_width: int,
+    start_size: int,
+    min_size: int = 18,
+) -> ImageFont.FreeTypeFont:
+    """
+    Wie _fit_text, aber ohne draw-Objekt (misst per font.getlength) und gecacht:
+    für feste Strings (Titel etc.) ändert sich das Ergebnis nie.
+    """
+    lines = str(text).split("\n")
+    size = start_size
+    while size >= min_size:
+        font = _load_font_cached(font_path_str, size)
+        # multiline-safe: max width der einzelnen Zeilen messen
+        w = max((int(font.getlength(line)) for line in lines), default=0)
         if w <= max_width:
             return font
         size -= 2
-    return _load_font(font_path, min_size)
+    return _load_font_cached(font_path_str, min_size)
 
 import re
 def _text_w(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont) -> int:
     # PIL-sicher (auch bei Sonderzeichen). Kein multiline hier!
-    bbox = draw.textbbox((0, 0), text, font=font)
-    return int(bbox[2] - bbox[0])
+    if "\n" in text:
+        bbox = draw.textbbox((0, 0), text, font=font)
+        return int(bbox[2] - bbox[0])
+    return _text_bbox_w_cached(font, text, draw.fontmode)
 
 
 def _split_first_last(fake_name: str) -> tuple[str, str]:
@@ -241,21 +334,17 @@ def _draw_player_block_centered(
         _fx(x0 + w_prefix + (gap_px if prefix else 0), y0 + line_gap_px, last)
 
 
+@lru_cache(maxsize=512)
 def _slugify_team_name(name: str) -> str:
     s = (name or "").strip().lower()
     # german chars
-    s = (
-        s.replace("ä", "ae")
-         .replace("ö", "oe")
-         .replace("ü", "ue")
-         .replace("ß", "ss")
-    )
+    s = s.translate(_UMLAUT_TABLE)
     # whitespace / underscores -> dash
-    s = re.sub(r"[\s_]+", "-", s)
+    s = _RE_SLUG_WS.sub("-", s)
     # remove everything not alnum or dash
-    s = re.sub(r"[^a-z0-9\-]+", "", s)
+    s = _RE_SLUG_NONALNUM.sub("", s)
     # clean repeated dashes
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    s = _RE_SLUG_DASHES.sub("-", s).strip("-")
     return s
 
 
@@ -268,10 +357,16 @@ def _load_team_display_map(fonts_dir: Path) -> Dict[str, str]:
     """
     p = fonts_dir.parent / "team_display_names.json"
     if p.exists():
-        return json.loads(p.read_text(encoding="utf-8"))
+        return _load_display_map_cached(str(p), p.stat().st_mtime_ns)
     return {}
 
 
+@lru_cache(maxsize=8)
+def _load_display_map_cached(path_str: str, mtime_ns: int) -> Dict[str, str]:
+    # geparstes team_display_names.json pro (Datei, mtime); Dict wird geteilt -> nur lesen
+    return _loads_bytes(Path(path_str).read_bytes())
+
+
 def _team_name_to_logo_slug(team_name: str, display_map: Dict[str, str]) -> str:
     """
     display_map is slug -> display.
@@ -381,24 +476,44 @@ def draw_text_fx(
     stroke: bool = True,
     stroke_width: int = 2,
     stroke_fill: Tuple[int, int, int, int] = (0, 0, 0, 140),
+    target_layer: Optional[Image.Image] = None,
 ) -> None:
     """
     Subtiler Broadcast-FX: Shadow + Stroke + optional Glow.
+
+    target_layer: gemeinsamer RGBA-Layer (Bildgröße), in den Shadow/Stroke/Main gezeichnet
+    werden; der Aufrufer compositet ihn am Ende EINMAL auf img. Ohne -> eigene enge Kachel pro Aufruf.
     """
+    if not text:
+        # leerer Text zeichnet nichts -> keine Vollbild-Layer/Blur für nichts anlegen
+        return
+
     x, y = pos
 
-    base = Image.new("RGBA", img.size, (0, 0, 0, 0))
+    if target_layer is not None:
+        base, ox, oy = target_layer, 0, 0
+    else:
+        # Kachel nur so groß wie Text + Stroke + Shadow (auf Bildgrenzen geklemmt):
+        # Composite-Aufwand skaliert mit der Textfläche statt mit dem ganzen Bild
+        sw = stroke_width if stroke and stroke_width > 0 else 0
+        sx, sy = shadow_offset if shadow else (0, 0)
+        l, t, r, b = _MEASURE_DRAW.textbbox((x, y), text, font=font, anchor=anchor, stroke_width=sw)
+        ox = max(0, math.floor(min(l, l + sx)) - 2)
+        oy = max(0, math.floor(min(t, t + sy)) - 2)
+        ox1 = min(img.size[0], math.ceil(max(r, r + sx)) + 2)
+        oy1 = min(img.size[1], math.ceil(max(b, b + sy)) + 2)
+        base = Image.new("RGBA", (max(1, ox1 - ox), max(1, oy1 - oy)), (0, 0, 0, 0))
     d = ImageDraw.Draw(base)
 
     # Shadow
     if shadow:
         sx, sy = shadow_offset
-        d.text((x + sx, y + sy), text, font=font, fill=(0, 0, 0, shadow_alpha), anchor=anchor)
+        d.text((x - ox + sx, y - oy + sy), text, font=font, fill=(0, 0, 0, shadow_alpha), anchor=anchor)
 
-    # Stroke
+    # Stroke + Main in einem Aufruf (PIL zeichnet erst die Kontur, dann die Füllung)
     if stroke and stroke_width > 0:
         d.text(
-            (x, y),
+            (x - ox, y - oy),
             text,
             font=font,
             fill=fill,
@@ -406,19 +521,120 @@ def draw_text_fx(
             stroke_width=stroke_width,
             stroke_fill=stroke_fill,
         )
-
-    # Main
-    d.text((x, y), text, font=font, fill=fill, anchor=anchor)
+    else:
+        d.text((x - ox, y - oy), text, font=font, fill=fill, anchor=anchor)
 
     # Glow
     if glow:
-        glow_layer = Image.new("RGBA", img.size, (0, 0, 0, 0))
-        gd = ImageDraw.Draw(glow_layer)
-        gd.text((x, y), text, font=font, fill=(fill[0], fill[1], fill[2], glow_alpha), anchor=anchor)
-        glow_layer = glow_layer.filter(ImageFilter.GaussianBlur(radius=glow_radius))
-        img.alpha_composite(glow_layer)
+        # enge Kachel (Text-bbox + Blur-Reichweite, auf Bildgrenzen geklemmt) statt Vollbild-Blur;
+        # außerhalb ist der Layer ohnehin transparent -> gleiches Ergebnis
+        l, t, r, b = _MEASURE_DRAW.textbbox((x, y), text, font=font, anchor=anchor)
+        pad = glow_radius * 3 + 2
+        gx0 = max(0, int(l) - pad)
+        gy0 = max(0, int(t) - pad)
+        gx1 = min(img.size[0], int(r) + pad)
+        gy1 = min(img.size[1], int(b) + pad)
+        if gx1 > gx0 and gy1 > gy0:
+            glow_layer = Image.new("RGBA", (gx1 - gx0, gy1 - gy0), (0, 0, 0, 0))
+            gd = ImageDraw.Draw(glow_layer)
+            gd.text((x - gx0, y - gy0), text, font=font, fill=(fill[0], fill[1], fill[2], glow_alpha), anchor=anchor)
+            glow_layer = glow_layer.filter(ImageFilter.GaussianBlur(radius=glow_radius))
+            img.alpha_composite(glow_layer, (gx0, gy0))
+
+    if target_layer is None:
+        img.alpha_composite(base, (ox, oy))
+
+
+@lru_cache(maxsize=512)
+def _render_text_fx_cached(
+    text: str,
+    font_path_str: str,
+    size: int,
+    fill: Tuple[int, int, int, int],
+    anchor: str = "mm",
+    shadow_offset: Tuple[int, int] = (0, 2),
+    shadow_alpha: int = 120,
+    stroke_width: int = 2,
+    stroke_fill: Tuple[int, int, int, int] = (0, 0, 0, 140),
+) -> Tuple[Image.Image, Tuple[int, int]]:
+    """
+    draw_text_fx (Shadow + Stroke, ohne Glow) als enge, gecachte Kachel.
+    Rückgabe: (Kachel, Offset ihrer linken oberen Ecke relativ zum Anker).
+    Kachel wird geteilt -> nur als Quelle für alpha_composite nutzen.
+    """
+    font = _load_font_cached(font_path_str, size)
+    l, t, r, b = font.getbbox(text, anchor=anchor, stroke_width=stroke_width)
+    sx, sy = shadow_offset
+    pad = 2
+    x0 = math.floor(min(l, l + sx)) - pad
+    y0 = math.floor(min(t, t + sy)) - pad
+    x1 = math.ceil(max(r, r + sx)) + pad
+    y1 = math.ceil(max(b, b + sy)) + pad
+
+    tile = Image.new("RGBA", (x1 - x0, y1 - y0), (0, 0, 0, 0))
+    d = ImageDraw.Draw(tile)
+    ax, ay = -x0, -y0
+
+    d.text((ax + sx, ay + sy), text, font=font, fill=(0, 0, 0, shadow_alpha), anchor=anchor)
+    # Stroke + Main in einem Aufruf (wie draw_text_fx)
+    if stroke_width > 0:
+        d.text(
+            (ax, ay),
+            text,
+            font=font,
+            fill=fill,
+            anchor=anchor,
+            stroke_width=stroke_width,
+            stroke_fill=stroke_fill,
+        )
+    else:
+        d.text((ax, ay), text, font=font, fill=fill, anchor=anchor)
+
+    return tile, (x0, y0)
+
+
+# Nur zum Messen (textbbox hängt nicht von der Bildgröße ab) -> kein Vollbild-Canvas pro Aufruf
+_MEASURE_DRAW = ImageDraw.Draw(Image.new("RGBA", (1, 1), (0, 0, 0, 0)))
+
+
+@lru_cache(maxsize=8)
+def _speck_offsets(speck_size: int) -> Tuple[Tuple[int, int], ...]:
+    # Pixel eines Specks relativ zur Mitte – direkt aus PILs ellipse, damit die Form identisch bleibt
+    d = 2 * speck_size + 1
+    stamp = Image.new("L", (d, d), 0)
+    ImageDraw.Draw(stamp).ellipse((0, 0, 2 * speck_size, 2 * speck_size), fill=255)
+    px = stamp.load()
+    return tuple(
+        (dx - speck_size, dy - speck_size)
+        for dy in range(d)
+        for dx in range(d)
+        if px[dx, dy]
+    )
+
+
+def _speck_noise_mask(bw: int, bh: int, n: int, speck_size: int) -> Image.Image:
+    """
+    L-Maske mit n Specks (255) im Feld bw x bh.
+    Koordinaten kommen weiter aus `random` (gleiche Sequenz bei gleichem seed),
+    gestempelt wird mit numpy statt n-mal ellipse().
+    """
+    pts = [(random.randint(0, bw - 1), random.randint(0, bh - 1)) for _ in range(n)]
+
+    if np is None:
+        noise = Image.new("L", (bw, bh), 0)
+        nd = ImageDraw.Draw(noise)
+        for x, y in pts:
+            nd.ellipse((x - speck_size, y - speck_size, x + speck_size, y + speck_size), fill=255)
+        return noise
 
-    img.alpha_composite(base)
+    arr = np.zeros((bh, bw), dtype=np.uint8)
+    xa, ya = np.asarray(pts, dtype=np.intp).reshape(-1, 2).T
+    for dx, dy in _speck_offsets(speck_size):
+        xx = xa + dx
+        yy = ya + dy
+        ok = (xx >= 0) & (xx < bw) & (yy >= 0) & (yy < bh)
+        arr[yy[ok], xx[ok]] = 255
+    return Image.fromarray(arr, "L")
 
 
 def draw_text_ice_noise_bbox(
@@ -442,9 +658,7 @@ def draw_text_ice_noise_bbox(
         random.seed(seed)
 
     # bbox für Text berechnen
-    tmp = Image.new("RGBA", img.size, (0, 0, 0, 0))
-    td = ImageDraw.Draw(tmp)
-    l, t, r, b = td.textbbox(pos, text, font=font, anchor=anchor)
+    l, t, r, b = _MEASURE_DRAW.textbbox(pos, text, font=font, anchor=anchor)
 
     l = max(0, l)
     t = max(0, t)
@@ -459,19 +673,19 @@ def draw_text_ice_noise_bbox(
     md.text((pos[0] - l, pos[1] - t), text, font=font, fill=255, anchor=anchor)
 
     # Noise in Box
-    noise = Image.new("L", (bw, bh), 0)
-    nd = ImageDraw.Draw(noise)
-
     n = int(bw * bh * intensity / 120)
     n = max(120, n)  # Minimum, damit es sicher sichtbar ist
 
-    for _ in range(n):
-        x = random.randint(0, bw - 1)
-        y = random.randint(0, bh - 1)
-        nd.ellipse((x - speck_size, y - speck_size, x + speck_size, y + speck_size), fill=255)
+    noise = _speck_noise_mask(bw, bh, n, speck_size)
 
-    scratched = ImageChops.subtract(text_mask, noise)
-    scratched = scratched.point(lambda p: 255 if p > threshold else 0)
+    if np is not None:
+        # subtract + threshold in einem Vektor-Schritt (int16, damit nichts überläuft)
+        diff = np.asarray(text_mask, dtype=np.int16) - np.asarray(noise, dtype=np.int16)
+        np.clip(diff, 0, 255, out=diff)
+        scratched = Image.fromarray(np.where(diff > threshold, 255, 0).astype(np.uint8), "L")
+    else:
+        scratched = ImageChops.subtract(text_mask, noise)
+        scratched = scratched.point(lambda p: 255 if p > threshold else 0)
 
     layer = Image.new("RGBA", (bw, bh), fill)
     img.paste(layer, (l, t), mask=scratched)
@@ -496,9 +710,7 @@ def draw_text_grain_overlay_bbox(
         random.seed(seed)
 
     # bbox
-    tmp = Image.new("RGBA", img.size, (0, 0, 0, 0))
-    td = ImageDraw.Draw(tmp)
-    l, t, r, b = td.textbbox(pos, text, font=font, anchor=anchor)
+    l, t, r, b = _MEASURE_DRAW.textbbox(pos, text, font=font, anchor=anchor)
     l = max(0, l); t = max(0, t)
     r = min(img.size[0], r); b = min(img.size[1], b)
     bw = max(1, r - l); bh = max(1, b - t)
@@ -546,6 +758,10 @@ def _load_logo(
 ) -> Image.Image:
     p = logos_dir / f"{team_id}.png"
     if p.exists():
+        # vorskaliertes Logo (siehe prebuild_logo_sidecars) spart Decode der großen Quelle + LANCZOS
+        sidecar = load_logo_sidecar(p, size)
+        if sidecar is not None:
+            return sidecar
         im = Image.open(p).convert("RGBA")
         return im.resize((size, size), Image.LANCZOS)
 
@@ -556,6 +772,27 @@ def _load_logo(
     return im
 
 
+def _logo_mtime(logos_dir_str: str, team_id: str) -> int:
+    # mtime_ns des Quell-Logos als Cache-Key (0 = fehlt -> Platzhalter)
+    try:
+        return os.stat(os.path.join(logos_dir_str, f"{team_id}.png")).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@lru_cache(maxsize=256)
+def _load_logo_cached(
+    logos_dir_str: str,
+    team_id: str,
+    size: int,
+    accent: Tuple[int, int, int, int],
+    mtime_ns: int,
+) -> Image.Image:
+    # Decode + LANCZOS-Resize einmal pro (Team, Größe, mtime). Geteiltes Master-Bild:
+    # nur als Quelle für alpha_composite/paste nutzen, nie darauf zeichnen.
+    return _load_logo(Path(logos_dir_str), team_id, size=size, accent=accent)
+
+
 # ----------------------------
 # Renderer
 # ----------------------------
@@ -576,6 +813,9 @@ def render_matchday_overview(
     img = Image.open(template_path).convert("RGBA")
     draw = ImageDraw.Draw(img)
 
+    # alle draw_text_fx-Aufrufe zeichnen in EINEN Layer, der am Ende einmal gecompositet wird
+    fx_layer = Image.new("RGBA", img.size, (0, 0, 0, 0))
+
     # Fonts
     font_bold_path = fonts_dir / "Inter-Bold.ttf"
     font_med_path = fonts_dir / "Inter-Medium.ttf"
@@ -611,6 +851,7 @@ def render_matchday_overview(
             stroke=True,
             stroke_width=3,
             stroke_fill=(0, 0, 0, 200),
+            target_layer=fx_layer,
         )
 
     elif header_fx == "ice_noise":
@@ -646,6 +887,7 @@ def render_matchday_overview(
             stroke=True,
             stroke_width=2,
             stroke_fill=(0, 0, 0, 160),
+            target_layer=fx_layer,
         )
 
 
@@ -673,7 +915,7 @@ def render_matchday_overview(
 
 
     # Define watermark font before use
-    wm_font = ImageFont.truetype(str(fonts_dir / "Inter-Medium.ttf"), size=20)
+    wm_font = _load_font(font_med_path, 20)
     _draw_watermark(
         img,
         draw,
@@ -696,20 +938,27 @@ def render_matchday_overview(
     display_map_path = fonts_dir.parent / "team_display_names.json"
     display_map: Dict[str, str] = {}
     if display_map_path.exists():
-        display_map = json.loads(display_map_path.read_text(encoding="utf-8"))
+        display_map = _load_display_map_cached(str(display_map_path), display_map_path.stat().st_mtime_ns)
+
+    logos_dir_str = str(logos_dir)
+
+    # Fonts für alle Zeilen gleich -> einmal vor der Schleife ("VS" ist konstant, braucht kein Fitting pro Zeile)
+    team_font = _load_font(font_bold_path, team_size)
+    font_vs = (
+        _fit_text(draw, "VS", font_med_path, max_width=120, start_size=vs_size, min_size=22)
+        if enable_draw_vs
+        else None
+    )
 
     def draw_match_row(y: int, home_id: str, away_id: str) -> None:
-        logo_home = _load_logo(logos_dir, home_id, layout.logo_size, layout.color_accent)
-        logo_away = _load_logo(logos_dir, away_id, layout.logo_size, layout.color_accent)
+        logo_home = _load_logo_cached(logos_dir_str, home_id, layout.logo_size, layout.color_accent, _logo_mtime(logos_dir_str, home_id))
+        logo_away = _load_logo_cached(logos_dir_str, away_id, layout.logo_size, layout.color_accent, _logo_mtime(logos_dir_str, away_id))
 
         home_label = display_map.get(home_id, home_id.replace("-", " "))
         away_label = display_map.get(away_id, away_id.replace("-", " "))
         home_txt = home_label.upper()
         away_txt = away_label.upper()
 
-        team_font = _load_font(font_bold_path, team_size)
-
-
         # logos
         img.alpha_composite(logo_home, (layout.x_logo_home, int(y - layout.logo_size / 2)))
         img.alpha_composite(logo_away, (layout.x_logo_away, int(y - layout.logo_size / 2)))
@@ -731,6 +980,7 @@ def render_matchday_overview(
                 stroke=True,
                 stroke_width=2,
                 stroke_fill=(0, 0, 0, 190),
+                target_layer=fx_layer,
             )
             draw_text_fx(
                 img,
@@ -746,6 +996,7 @@ def render_matchday_overview(
                 stroke=True,
                 stroke_width=2,
                 stroke_fill=(0, 0, 0, 190),
+                target_layer=fx_layer,
             )
         else:
             draw.text((layout.x_text_home, y), home_txt, font=team_font, fill=layout.color_text, anchor="lm")
@@ -753,7 +1004,6 @@ def render_matchday_overview(
 
         # VS optional
         if enable_draw_vs:
-            font_vs = _fit_text(draw, "VS", font_med_path, max_width=120, start_size=vs_size, min_size=22)
             draw_text_fx(
                 img,
                 (layout.center_x, y),
@@ -768,6 +1018,7 @@ def render_matchday_overview(
                 shadow_offset=(0, 2),
                 shadow_alpha=120,
                 stroke=False,
+                target_layer=fx_layer,
             )
 
     for i, m in enumerate(nord):
@@ -777,6 +1028,11 @@ def render_matchday_overview(
         draw_match_row(layout.y_sued[i], m["home"], m["away"])
 
 
+    # nur den bemalten Bereich des fx-Layers compositen
+    fx_bbox = fx_layer.getbbox()
+    if fx_bbox:
+        img.alpha_composite(fx_layer, fx_bbox[:2], fx_bbox)
+
     out_path.parent.mkdir(parents=True, exist_ok=True)
     img.save(out_path)
     return out_path
@@ -2,14 +2,23 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
 
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
 from .layout_config import MatchdayLayoutV1
+from .logo_sidecars import load_logo_sidecar
+
+# Slug-Helfer: einmal kompilieren statt pro Aufruf
+_UMLAUT_TABLE = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+_RE_SLUG_WS = re.compile(r"[\s_]+")
+_RE_SLUG_NONALNUM = re.compile(r"[^a-z0-9\-]+")
+_RE_SLUG_DASHES = re.compile(r"-{2,}")
 
 
 # ----------------------------
@@ -50,13 +59,28 @@ def _safe_load_json(path: Path) -> Dict[str, Any]:
 
 
 def _load_font(font_path: Path, size: int) -> ImageFont.FreeTypeFont:
-    if not font_path.exists():
-        raise FileNotFoundError(f"Font not found: {font_path}")
-    return ImageFont.truetype(str(font_path), size)
+    return _load_font_cached(str(font_path), size)
+
+
+@lru_cache(maxsize=256)
+def _load_font_cached(path_str: str, size: int) -> ImageFont.FreeTypeFont:
+    # TTF einmal pro (Datei, Größe) parsen; FreeTypeFont wird nur gelesen, nie verändert
+    if not Path(path_str).exists():
+        raise FileNotFoundError(f"Font not found: {path_str}")
+    return ImageFont.truetype(path_str, size)
 
 
 def _text_w(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont) -> int:
-    bbox = draw.textbbox((0, 0), text, font=font)
+    if "\n" in text:
+        bbox = draw.textbbox((0, 0), text, font=font)
+        return int(bbox[2] - bbox[0])
+    return _text_bbox_w_cached(font, text, draw.fontmode)
+
+
+@lru_cache(maxsize=4096)
+def _text_bbox_w_cached(font: ImageFont.FreeTypeFont, text: str, mode: str) -> int:
+    # Key ist das Font-Objekt selbst (kommt aus _load_font_cached, also stabil)
+    bbox = font.getbbox(text, mode)
     return int(bbox[2] - bbox[0])
 
 
@@ -190,17 +214,13 @@ def draw_text_fx(
 # ----------------------------
 # Slugs / Logos
 # ----------------------------
+@lru_cache(maxsize=512)
 def _slugify_team_name(name: str) -> str:
     s = (name or "").strip().lower()
-    s = (
-        s.replace("ä", "ae")
-         .replace("ö", "oe")
-         .replace("ü", "ue")
-         .replace("ß", "ss")
-    )
-    s = re.sub(r"[\s_]+", "-", s)
-    s = re.sub(r"[^a-z0-9\-]+", "", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    s = s.translate(_UMLAUT_TABLE)
+    s = _RE_SLUG_WS.sub("-", s)
+    s = _RE_SLUG_NONALNUM.sub("", s)
+    s = _RE_SLUG_DASHES.sub("-", s).strip("-")
     return s
 
 
@@ -208,10 +228,16 @@ def _load_team_display_map(assets_dir: Path) -> Dict[str, str]:
     # gleiche Regel wie bisher: assets/team_display_names.json
     p = assets_dir / "team_display_names.json"
     if p.exists():
-        return json.loads(p.read_text(encoding="utf-8"))
+        return _load_display_map_cached(str(p), p.stat().st_mtime_ns)
     return {}
 
 
+@lru_cache(maxsize=8)
+def _load_display_map_cached(path_str: str, mtime_ns: int) -> Dict[str, str]:
+    # geparstes team_display_names.json pro (Datei, mtime); Dict wird geteilt -> nur lesen
+    return json.loads(Path(path_str).read_text(encoding="utf-8"))
+
+
 def _team_name_to_logo_slug(team_name: str, display_map: Dict[str, str]) -> str:
     """
     display_map ist slug -> display-name (euer Setup).
@@ -232,6 +258,9 @@ def _load_logo(
 ) -> Image.Image:
     p = logos_dir / f"{team_id}.png"
     if p.exists():
+        sidecar = load_logo_sidecar(p, size)
+        if sidecar is not None:
+            return sidecar
         im = Image.open(p).convert("RGBA")
         return im.resize((size, size), Image.LANCZOS)
 
@@ -242,6 +271,27 @@ def _load_logo(
     return im
 
 
+def _logo_mtime(logos_dir_str: str, team_id: str) -> int:
+    # mtime_ns des Quell-Logos als Cache-Key (0 = fehlt -> Platzhalter)
+    try:
+        return os.stat(os.path.join(logos_dir_str, f"{team_id}.png")).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@lru_cache(maxsize=256)
+def _load_logo_cached(
+    logos_dir_str: str,
+    team_id: str,
+    size: int,
+    accent: Tuple[int, int, int, int],
+    mtime_ns: int,
+) -> Image.Image:
+    # Decode + LANCZOS-Resize einmal pro (Team, Größe, mtime). Geteiltes Master-Bild:
+    # nur als Quelle für alpha_composite/paste nutzen, nie darauf zeichnen.
+    return _load_logo(Path(logos_dir_str), team_id, size=size, accent=accent)
+
+
 # ----------------------------
 # Replay -> 2-Satz MVP
 # ----------------------------
@@ -449,12 +499,14 @@ def render_matchday_results_overview(
     def _display_team(slug: str) -> str:
         return (display_map.get(slug, slug.replace("-", " "))).upper()
 
+    logos_dir_str = str(paths.logos_dir)
+
     def draw_match_row(y: int, home_name: str, away_name: str, gh: int, ga: int) -> None:
         home_slug = _team_name_to_logo_slug(home_name, display_map)
         away_slug = _team_name_to_logo_slug(away_name, display_map)
 
-        logo_home = _load_logo(paths.logos_dir, home_slug, layout.logo_size, layout.color_accent)
-        logo_away = _load_logo(paths.logos_dir, away_slug, layout.logo_size, layout.color_accent)
+        logo_home = _load_logo_cached(logos_dir_str, home_slug, layout.logo_size, layout.color_accent, _logo_mtime(logos_dir_str, home_slug))
+        logo_away = _load_logo_cached(logos_dir_str, away_slug, layout.logo_size, layout.color_accent, _logo_mtime(logos_dir_str, away_slug))
 
         home_txt = _display_team(home_slug)
         away_txt = _display_team(away_slug)
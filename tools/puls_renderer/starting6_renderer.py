@@ -17,7 +17,8 @@ from .renderer import (
     _fit_text,
     draw_text_fx,
     draw_text_ice_noise_bbox,
-    _load_logo,
+    _load_logo_cached,
+    _logo_mtime,
     _draw_watermark,
     _draw_player_block_centered,
 )
@@ -130,8 +131,9 @@ def render_starting6_from_files(
     home_id = slugify_team(home_team)
     away_id = slugify_team(away_team)
 
-    logo_home = _load_logo(paths.logos_dir, home_id, layout.logo_size, layout.color_accent)
-    logo_away = _load_logo(paths.logos_dir, away_id, layout.logo_size, layout.color_accent)
+    logos_dir_str = str(paths.logos_dir)
+    logo_home = _load_logo_cached(logos_dir_str, home_id, layout.logo_size, layout.color_accent, _logo_mtime(logos_dir_str, home_id))
+    logo_away = _load_logo_cached(logos_dir_str, away_id, layout.logo_size, layout.color_accent, _logo_mtime(logos_dir_str, away_id))
 
     img.alpha_composite(logo_home, (540 - layout.logo_size // 2, layout.home_logo_y - layout.logo_size // 2))
     img.alpha_composite(logo_away, (540 - layout.logo_size // 2, layout.away_logo_y - layout.logo_size // 2))